@@ -17,24 +17,27 @@ from grok_py.tools.base import SyncTool, AsyncTool, ToolCategory, ToolResult, re
 from grok_py.ui.components.progress import ProgressIndicator
 
 
+# Archive type by final file extension (without the leading dot). Only the
+# last suffix is considered, so "x.tar.gz" is detected as gzip.
+_ARCHIVE_TYPES_BY_EXTENSION = {
+    'zip': 'zip',
+    'tar': 'tar',
+    'tgz': 'tar',
+    'tbz2': 'tar',
+    'txz': 'tar',
+    'gz': 'gzip',
+    'bz2': 'bzip2',
+    'xz': 'lzma',
+}
+
+
 class ArchiveHelper:
     """Helper class for archive operations."""
 
     @staticmethod
     def detect_archive_type(file_path: Path) -> Optional[str]:
         """Detect archive type from file extension."""
-        suffix = file_path.suffix.lower()
-        if suffix == '.zip':
-            return 'zip'
-        elif suffix in ['.tar', '.tgz', '.tar.gz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz']:
-            return 'tar'
-        elif suffix == '.gz':
-            return 'gzip'
-        elif suffix == '.bz2':
-            return 'bzip2'
-        elif suffix == '.xz':
-            return 'lzma'
-        return None
+        return _ARCHIVE_TYPES_BY_EXTENSION.get(file_path.suffix[1:].lower())
 
     @staticmethod
     def get_compression_mode(filename: str) -> str:
@@ -46,8 +46,9 @@ class BashTool(AsyncTool):
 
             # Safety check: prevent potentially dangerous commands
             dangerous_commands = ['rm -rf /', 'dd if=', 'mkfs', 'fdisk', 'format']
+            command_lower = command.lower()
             for dangerous in dangerous_commands:
-                if dangerous in command.lower():
+                if dangerous in command_lower:
                     return ToolResult(
                         success=False,
                         error=f"Command contains potentially dangerous operation: {dangerous}"
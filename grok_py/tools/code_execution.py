@@ -1,7 +1,6 @@
 """Safe code execution tool using direct subprocess execution."""
 
 import subprocess
-import shlex
 import tempfile
 import os
 import uuid
@@ -21,6 +20,27 @@ class Language(Enum):
     BASH = "bash"
 
 
+# Source file suffix and interpreter argv prefix per language; the command
+# for a run is the prefix followed by the code file path
+_FILE_SUFFIXES = {
+    Language.PYTHON: '.py',
+    Language.JAVASCRIPT: '.js',
+    Language.BASH: '.sh',
+}
+_INTERPRETER_COMMANDS = {
+    Language.PYTHON: ('python3',),
+    Language.JAVASCRIPT: ('node',),
+    Language.BASH: ('bash',),
+}
+
+# Descriptions returned by CodeExecutionTool.get_language_config
+_LANGUAGE_CONFIGS = {
+    Language.PYTHON: {'name': 'Python', 'extensions': ['.py'], 'interpreter': 'python3'},
+    Language.JAVASCRIPT: {'name': 'JavaScript', 'extensions': ['.js'], 'interpreter': 'node'},
+    Language.BASH: {'name': 'Bash', 'extensions': ['.sh'], 'interpreter': 'bash'},
+}
+
+
 class CodeExecutionTool(SyncTool):
     """Tool for safe code execution directly via subprocess."""
 
@@ -49,7 +69,7 @@ class CodeExecutionTool(SyncTool):
         Returns:
             ToolResult with execution result
         """
-        logger.info(f"CodeExecutionTool.execute_sync called with language={language}, operation={operation}")
+        logger.info("CodeExecutionTool.execute_sync called with language=%s, operation=%s", language, operation)
         try:
             # Validate operation
             if operation not in ['run', 'test']:
@@ -80,12 +100,12 @@ class CodeExecutionTool(SyncTool):
                     error=f"Unsupported language: {language}. Supported: {[l.value for l in Language]}"
                 )
 
-            logger.info(f"About to execute code with language {detected_lang.value}")
+            logger.info("About to execute code with language %s", detected_lang.value)
             # Execute the code directly
             return self._execute_code_direct(code, detected_lang, input, operation == 'test')
 
         except Exception as e:
-            logger.error(f"Code execution failed: {e}", exc_info=True)
+            logger.error("Code execution failed: %s", e, exc_info=True)
             return ToolResult(
                 success=False,
                 error=f"Code execution failed: {str(e)}"
@@ -104,11 +124,7 @@ class CodeExecutionTool(SyncTool):
 
         try:
             # Write code to temporary file
-            suffix = {
-                Language.PYTHON: '.py',
-                Language.JAVASCRIPT: '.js',
-                Language.BASH: '.sh'
-            }.get(language, '.txt')
+            suffix = _FILE_SUFFIXES.get(language, '.txt')
 
             with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False) as code_file:
                 code_file.write(code)
@@ -118,15 +134,8 @@ class CodeExecutionTool(SyncTool):
             os.chmod(code_file_path, 0o644)
 
             # Determine command
-            commands = {
-                Language.PYTHON: ['python3', code_file_path],
-                Language.JAVASCRIPT: ['node', code_file_path],
-                Language.BASH: ['bash', code_file_path]
-            }
-
-            cmd = commands.get(language)
-            if not cmd:
-                os.unlink(code_file_path)
+            interpreter = _INTERPRETER_COMMANDS.get(language)
+            if not interpreter:
                 return ToolResult(
                     success=False,
                     error=f"No command defined for language: {language.value}"
@@ -138,7 +147,7 @@ class CodeExecutionTool(SyncTool):
             start_time = time.time()
             try:
                 result = subprocess.run(
-                    cmd,
+                    [*interpreter, code_file_path],
                     input=input_data,
                     capture_output=True,
                     text=True,
@@ -187,7 +196,6 @@ class CodeExecutionTool(SyncTool):
 
             except subprocess.TimeoutExpired:
                 execution_time = time.time() - start_time
-                os.unlink(code_file_path)
                 return ToolResult(
                     success=False,
                     error="Code execution timed out",
@@ -199,18 +207,17 @@ class CodeExecutionTool(SyncTool):
                 )
 
         except Exception as e:
-            logger.error(f"Error in direct code execution: {e}")
-            if 'code_file_path' in locals():
-                os.unlink(code_file_path)
+            logger.error("Error in direct code execution: %s", e)
             return ToolResult(
                 success=False,
                 error=f"Code execution failed: {str(e)}"
             )
         finally:
+            # Single cleanup point for the temporary code file
             if 'code_file_path' in locals():
                 try:
                     os.unlink(code_file_path)
-                except:
+                except OSError:
                     pass
 
     def get_supported_languages(self) -> list:
@@ -229,11 +236,10 @@ class CodeExecutionTool(SyncTool):
         """Get configuration for a specific language."""
         try:
             lang = Language(language.lower())
-            configs = {
-                Language.PYTHON: {'name': 'Python', 'extensions': ['.py'], 'interpreter': 'python3'},
-                Language.JAVASCRIPT: {'name': 'JavaScript', 'extensions': ['.js'], 'interpreter': 'node'},
-                Language.BASH: {'name': 'Bash', 'extensions': ['.sh'], 'interpreter': 'bash'}
-            }
-            return configs.get(lang, {})
+            config = _LANGUAGE_CONFIGS.get(lang)
+            if not config:
+                return {}
+            # Copy so callers cannot mutate the shared table
+            return {**config, 'extensions': list(config['extensions'])}
         except ValueError:
             return {}
@@ -25,6 +25,14 @@ class StatusDisplay:
         self.console = console or Console()
         self.status_items: Dict[str, Dict[str, Any]] = {}
 
+        # Prime psutil's CPU counter so show_system_info can read usage
+        # since the display started without blocking to sample it
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
+
     def set_status(self, key: str, status: str, color: str = "white", details: Optional[str] = None):
         """Set a status item."""
         self.status_items[key] = {
@@ -126,7 +134,7 @@ class StatusDisplay:
             system_info = f"""
 OS: {platform.system()} {platform.release()}
 Python: {platform.python_version()}
-CPU: {psutil.cpu_percent()}%
+CPU: {psutil.cpu_percent(interval=None)}%
 Memory: {psutil.virtual_memory().percent}%
 Disk: {psutil.disk_usage('/').percent}%
 PID: {os.getpid()}
@@ -136,7 +136,7 @@ class TerminalUI:
             self.show_model_selection = False
             self.model_suggestions = []
 
-    def show_confirmation(self, details: str, diff: str = ""):
+    def open_confirmation(self, details: str, diff: str = ""):
         """Show confirmation dialog with operation details and optional diff."""
         self.confirmation_details = details
         self.confirmation_diff = diff
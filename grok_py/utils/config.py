@@ -1,13 +1,52 @@
 """Configuration management for Grok CLI."""
 
+import atexit
+import functools
 import json
 import os
+import pickle
+import threading
+import weakref
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
-
-
-@dataclass
+from dataclasses import MISSING, asdict, dataclass, fields
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _with_from_dict(cls):
+    """Attach a generated ``from_dict(data)`` constructor to a dataclass.
+
+    The generated function passes every field positionally with its default
+    bound in, avoiding the ``cls(**data)`` keyword binding. Keys that are not
+    fields are ignored, and data that is not a dict (such as a section set to
+    null) gives the defaults.
+    """
+    namespace = {'cls': cls}
+    args = []
+    for i, field in enumerate(fields(cls)):
+        if field.default is MISSING:
+            raise TypeError(f"{cls.__name__}.{field.name} needs a default for from_dict")
+        namespace[f'_default_{i}'] = field.default
+        args.append(f"data.get({field.name!r}, _default_{i})")
+
+    source = (
+        "def from_dict(data):\n"
+        "    if not isinstance(data, dict):\n"
+        "        data = {}\n"
+        f"    return cls({', '.join(args)})\n"
+    )
+    exec(compile(source, f"<{cls.__name__}.from_dict>", "exec"), namespace)
+    cls.from_dict = staticmethod(namespace['from_dict'])
+    return cls
+
+
+@_with_from_dict
+@dataclass(slots=True)
 class FileOpsConfig:
     """Configuration for file operations."""
     default_bulk_copy_overwrite: bool = False
@@ -25,7 +64,8 @@ class FileOpsConfig:
             self.exclude_patterns = ['*.tmp', '*.bak', '*.swp', '.git', '__pycache__', 'node_modules']
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class IntegrityConfig:
     """Configuration for integrity operations."""
     default_algorithms: List[str] = None
@@ -38,7 +78,8 @@ class IntegrityConfig:
             self.default_algorithms = ["md5", "sha256"]
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class ArchiveConfig:
     """Configuration for archive operations."""
     default_compression_type: str = "gzip"
@@ -51,7 +92,8 @@ class ArchiveConfig:
             self.exclude_patterns = ['*.tmp', '*.bak', '*.swp', '.git', '__pycache__']
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class VersionControlConfig:
     """Configuration for version control operations."""
     default_remote: str = "origin"
@@ -61,7 +103,7 @@ class VersionControlConfig:
     create_backup_before_reset: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class GrokCLIConfig:
     """Main configuration for Grok CLI."""
     file_ops: FileOpsConfig = None
@@ -84,22 +126,74 @@ class GrokCLIConfig:
             self.version_control = VersionControlConfig()
 
 
+# Nested config sections and their dataclasses; sections are addressable as
+# "<section>.<field>" in update_config
+_SECTION_TYPES = {
+    'file_ops': FileOpsConfig,
+    'integrity': IntegrityConfig,
+    'archive': ArchiveConfig,
+    'version_control': VersionControlConfig,
+}
+_SECTIONS = frozenset(_SECTION_TYPES)
+
+# Bump when the pickled cache layout changes
+_CACHE_FORMAT_VERSION = 1
+
+# Field names of every config dataclass, part of the cache key. Slotted
+# dataclasses unpickle their state positionally, so a cache written by a
+# version with different fields must not be reused.
+_CACHE_SCHEMA = (_CACHE_FORMAT_VERSION,) + tuple(
+    (cls.__name__, tuple(f.name for f in fields(cls)))
+    for cls in (GrokCLIConfig, *_SECTION_TYPES.values())
+)
+
+_MISSING = object()
+
+# Values compared by update_config to skip no-op saves. Lists and other
+# mutable values are always saved, since a caller may pass back the same
+# object after changing it in place.
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# Delay before update_config writes to disk, so bursts of updates coalesce
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+# Managers with unsaved updates, flushed at interpreter exit. Weak references
+# so registering for the exit flush does not keep a manager alive.
+_pending_managers: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending_managers():
+    """Write out updates still waiting on their debounce timer."""
+    for manager in list(_pending_managers):
+        manager.flush()
+
+
+@functools.cache
+def _default_config_dir() -> Path:
+    """Get the user's config directory (computed once per process)."""
+    home = Path.home()
+    if os.name == 'nt':  # Windows
+        return home / "AppData" / "Local" / "GrokCLI"
+    return home / ".config" / "grok-cli"  # Unix-like
+
+
 class ConfigManager:
     """Manager for configuration loading and saving."""
 
     def __init__(self, config_dir: Optional[Path] = None):
         if config_dir is None:
-            # Default to user's config directory
-            home = Path.home()
-            if os.name == 'nt':  # Windows
-                config_dir = home / "AppData" / "Local" / "GrokCLI"
-            else:  # Unix-like
-                config_dir = home / ".config" / "grok-cli"
+            config_dir = _default_config_dir()
 
+        # The directory is created on first save, not here, so constructing
+        # a manager has no filesystem side effects
         self.config_dir = config_dir
-        self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / "config.json"
+        self.cache_file = self.config_dir / "config.cache.pkl"
         self._config = None
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
 
     @property
     def config(self) -> GrokCLIConfig:
@@ -114,64 +208,140 @@ class ConfigManager:
             return GrokCLIConfig()
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Convert nested dicts back to dataclasses
+            stat = self.config_file.stat()
+            cache_key = (_CACHE_SCHEMA, stat.st_mtime_ns, stat.st_size)
+            cached = self._load_cached_config(cache_key)
+            if cached is not None:
+                return cached
+
+            raw = self.config_file.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+            # Convert nested dicts back to dataclasses and load simple fields in
+            # one pass (unknown keys are ignored; slotted dataclasses cannot
+            # grow new attributes)
             config = GrokCLIConfig()
-
-            if 'file_ops' in data:
-                config.file_ops = FileOpsConfig(**data['file_ops'])
-            if 'integrity' in data:
-                config.integrity = IntegrityConfig(**data['integrity'])
-            if 'archive' in data:
-                config.archive = ArchiveConfig(**data['archive'])
-            if 'version_control' in data:
-                config.version_control = VersionControlConfig(**data['version_control'])
-
-            # Load simple fields
             for key, value in data.items():
-                if key not in ['file_ops', 'integrity', 'archive', 'version_control']:
+                if key in _SECTIONS:
+                    setattr(config, key, _SECTION_TYPES[key].from_dict(value))
+                elif hasattr(config, key):
                     setattr(config, key, value)
 
+            self._store_cached_config(cache_key, config)
             return config
 
-        except (json.JSONDecodeError, OSError) as e:
+        except (ValueError, OSError) as e:
             print(f"Warning: Could not load config file: {e}")
             return GrokCLIConfig()
 
+    def _load_cached_config(self, cache_key: tuple) -> Optional[GrokCLIConfig]:
+        """Return the pickled config if it was built from the current config file."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                # The (schema, mtime_ns, size) header is pickled separately so a
+                # stale cache is rejected without unpickling the config itself.
+                if pickle.load(f) != cache_key:
+                    return None
+                config = pickle.load(f)
+        except Exception:
+            # Missing, truncated or incompatible cache: fall back to JSON
+            return None
+        return config if isinstance(config, GrokCLIConfig) else None
+
+    def _store_cached_config(self, cache_key: tuple, config: GrokCLIConfig):
+        """Write the parsed config to the side cache, ignoring failures."""
+        try:
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump(cache_key, f, protocol=5)
+                pickle.dump(config, f, protocol=5)
+        except (OSError, pickle.PicklingError):
+            pass
+
     def save_config(self):
-        """Save current configuration to file."""
+        """Save current configuration to file.
+
+        The file is written to a temporary sibling and moved into place with
+        os.replace, so readers never see a partially written config.
+        """
+        with self._save_lock:
+            self._save_locked()
+
+    def _save_locked(self):
+        """Write the config to disk; the caller holds _save_lock."""
+        self._cancel_pending_save()
+        # Cleared before the snapshot is taken, so an update made while the
+        # file is being written marks the config dirty again
+        self._dirty = False
+        tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
         try:
-            data = asdict(self.config)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._ensure_dir()
+            if HAS_ORJSON:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(
+                    asdict(self.config), indent=2, ensure_ascii=False
+                ).encode('utf-8')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.config_file)
         except OSError as e:
+            self._dirty = True
             print(f"Warning: Could not save config file: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _ensure_dir(self):
+        """Create the config directory if it does not exist yet."""
+        self.config_file.parent.mkdir(parents=True, exist_ok=True)
+
+    def flush(self):
+        """Write pending updates to disk immediately, if there are any."""
+        with self._save_lock:
+            if self._dirty:
+                self._save_locked()
+
+    def _cancel_pending_save(self):
+        """Cancel a scheduled debounced save."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+    def _schedule_save(self):
+        """Mark the config dirty and (re)start the debounced save timer."""
+        with self._save_lock:
+            self._dirty = True
+            _pending_managers.add(self)
+            self._cancel_pending_save()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def update_config(self, updates: Dict[str, Any]):
-        """Update configuration with new values."""
-        for key, value in updates.items():
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
-            elif key.startswith('file_ops.'):
-                sub_key = key.split('.', 1)[1]
-                if hasattr(self.config.file_ops, sub_key):
-                    setattr(self.config.file_ops, sub_key, value)
-            elif key.startswith('integrity.'):
-                sub_key = key.split('.', 1)[1]
-                if hasattr(self.config.integrity, sub_key):
-                    setattr(self.config.integrity, sub_key, value)
-            elif key.startswith('archive.'):
-                sub_key = key.split('.', 1)[1]
-                if hasattr(self.config.archive, sub_key):
-                    setattr(self.config.archive, sub_key, value)
-            elif key.startswith('version_control.'):
-                sub_key = key.split('.', 1)[1]
-                if hasattr(self.config.version_control, sub_key):
-                    setattr(self.config.version_control, sub_key, value)
+        """Update configuration with new values.
 
-        self.save_config()
+        Keys are top-level fields or dotted "<section>.<field>" paths; unknown
+        keys are ignored. Changes are written after a short debounce (see
+        SAVE_DEBOUNCE_SECONDS) or on flush().
+        """
+        changed = False
+        for key, value in updates.items():
+            section, sep, sub_key = key.partition('.')
+            if sep and section in _SECTIONS:
+                target, attr = getattr(self.config, section), sub_key
+            else:
+                target, attr = self.config, key
+
+            current = getattr(target, attr, _MISSING)
+            if current is _MISSING:
+                continue
+            if isinstance(value, _SCALAR_TYPES) and current == value:
+                continue
+            setattr(target, attr, value)
+            changed = True
+
+        if changed:
+            self._schedule_save()
 
     def get_config_path(self) -> Path:
         """Get the path to the configuration file."""
@@ -183,16 +353,13 @@ class ConfigManager:
         self.save_config()
 
 
-# Global config manager instance
-_config_manager = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config_manager() -> ConfigManager:
-    """Get the global configuration manager."""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    """Get the global configuration manager.
+
+    Use get_config_manager.cache_clear() to force a fresh manager.
+    """
+    return ConfigManager()
 
 
 def get_config() -> GrokCLIConfig:
@@ -206,7 +373,7 @@ def update_config(updates: Dict[str, Any]):
 
 
 def save_config():
-    """Save current configuration."""
+    """Save current configuration, including any pending debounced updates."""
     get_config_manager().save_config()
 
 
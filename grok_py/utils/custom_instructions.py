@@ -1,40 +1,164 @@
 """Custom instructions management for Grok agent."""
 
+import gzip
+import hashlib
+import json
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+import os
+import re
+import time
+import warnings
+import zlib
+from collections import deque
 from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from grok_py.utils.settings import get_custom_instructions_path, save_custom_instructions
 
 
 logger = logging.getLogger(__name__)
 
+# Append-only gzip'd JSONL log holding one record per backup
+BACKUP_LOG_NAME = "instructions_backups.jsonl.gz"
+
+# Per-backup files written by earlier versions, listed alongside the log
+LEGACY_BACKUP_PREFIX = "custom_instructions_backup_"
+LEGACY_BACKUP_TIME_FORMAT = "%Y%m%d_%H%M%S"
+
+# Phrases that suggest an attempt to override the system prompt
+_PROBLEMATIC_PHRASES = (
+    "ignore all previous instructions",
+    "forget your system prompt",
+    "you are now",
+    "override your",
+)
+_PROBLEMATIC_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in _PROBLEMATIC_PHRASES), re.IGNORECASE
+)
+
+# Starter templates returned by CustomInstructionsManager.get_template
+_TEMPLATES: Dict[str, str] = {
+    "basic": """# Custom Instructions for Grok Assistant
+
+You are Grok, a helpful and maximally truthful AI assistant built by xAI.
+
+## General Guidelines
+- Be helpful, truthful, and direct
+- Use clear, concise language
+- Admit when you don't know something
+- Use markdown formatting for better readability
+
+## Response Style
+- Structure responses with headers when appropriate
+- Use bullet points or numbered lists for multiple items
+- Provide code examples when relevant
+- Explain technical concepts clearly
+
+## Tool Usage
+- Use available tools when they would help answer questions
+- Explain what tools you're using and why
+- Be efficient with tool usage
+
+## Code and Technical Topics
+- Provide working, well-commented code examples
+- Explain code logic and key concepts
+- Suggest best practices and common pitfalls
+""",
+    "developer": """# Developer-Focused Custom Instructions
+
+You are Grok, specialized in software development and programming assistance.
+
+## Coding Guidelines
+- Write clean, readable, well-documented code
+- Follow language-specific best practices
+- Use appropriate design patterns
+- Include error handling and edge cases
+
+## Development Workflow
+- Suggest efficient development workflows
+- Recommend appropriate tools and libraries
+- Help with debugging and troubleshooting
+- Provide testing strategies
+
+## Architecture & Design
+- Think about scalability and maintainability
+- Consider security implications
+- Suggest appropriate architectural patterns
+- Help with code organization and structure
+
+## Best Practices
+- Follow industry standards and conventions
+- Suggest performance optimizations
+- Include logging and monitoring considerations
+- Promote code reusability and modularity
+""",
+    "minimal": """# Minimal Custom Instructions
+
+You are Grok, a helpful AI assistant.
+
+Be concise, accurate, and helpful in your responses.
+Use tools when they provide value.
+Explain your reasoning when appropriate.
+"""
+}
+
 
 class CustomInstructionsManager:
     """Manager for custom instructions used by the Grok agent."""
 
     def __init__(self):
         """Initialize the custom instructions manager."""
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # Instructions file contents, keyed on (st_mtime_ns, st_size)
+        self._cached: Optional[str] = None
+        self._cache_key: Optional[tuple] = None
 
     def get_instructions(self) -> Optional[str]:
         """Get the current custom instructions.
 
+        The file is only re-read when its mtime or size has changed since
+        the last call.
+
         Returns:
             Custom instructions text or None if not set
         """
         try:
-            from grok_py.utils.settings import load_custom_instructions
-            instructions = load_custom_instructions()
-            if instructions and instructions.strip():
-                self.logger.debug("Loaded custom instructions from file")
-                return instructions.strip()
-            return None
+            try:
+                stat = get_custom_instructions_path().stat()
+            except FileNotFoundError:
+                self._invalidate_cache()
+                return None
+
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            if cache_key != self._cache_key:
+                from grok_py.utils.settings import load_custom_instructions
+                instructions = load_custom_instructions()
+                self._cached = instructions.strip() if instructions and instructions.strip() else None
+                self._cache_key = cache_key
+                if self._cached:
+                    logger.debug("Loaded custom instructions from file")
+            return self._cached
         except Exception as e:
-            self.logger.error(f"Failed to load custom instructions: {e}")
+            logger.error(f"Failed to load custom instructions: {e}")
             return None
 
+    def _invalidate_cache(self) -> None:
+        """Forget the cached instructions so the next read goes to disk."""
+        self._cached = None
+        self._cache_key = None
+
+    def _current_instructions(self) -> Optional[str]:
+        """Get instructions from the cache, loading them on first use."""
+        if self._cache_key is None:
+            return self.get_instructions()
+        return self._cached
+
     def set_instructions(self, instructions: str, save: bool = True) -> bool:
         """Set custom instructions.
 
@@ -48,18 +172,19 @@ class CustomInstructionsManager:
         try:
             instructions = instructions.strip()
             if not instructions:
-                self.logger.warning("Cannot set empty instructions")
+                logger.warning("Cannot set empty instructions")
                 return False
 
             if save:
                 save_custom_instructions(instructions)
-                self.logger.info("Custom instructions saved to file")
+                self._invalidate_cache()
+                logger.info("Custom instructions saved to file")
             else:
-                self.logger.debug("Custom instructions set (not saved)")
+                logger.debug("Custom instructions set (not saved)")
 
             return True
         except Exception as e:
-            self.logger.error(f"Failed to set custom instructions: {e}")
+            logger.error(f"Failed to set custom instructions: {e}")
             return False
 
     def clear_instructions(self) -> bool:
@@ -71,10 +196,11 @@ class CustomInstructionsManager:
         try:
             # Save empty string to clear
             save_custom_instructions("")
-            self.logger.info("Custom instructions cleared")
+            self._invalidate_cache()
+            logger.info("Custom instructions cleared")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to clear custom instructions: {e}")
+            logger.error(f"Failed to clear custom instructions: {e}")
             return False
 
     def has_instructions(self) -> bool:
@@ -83,7 +209,7 @@ class CustomInstructionsManager:
         Returns:
             True if instructions exist and are not empty
         """
-        instructions = self.get_instructions()
+        instructions = self._current_instructions()
         return instructions is not None and bool(instructions.strip())
 
     def get_instructions_length(self) -> int:
@@ -92,7 +218,7 @@ class CustomInstructionsManager:
         Returns:
             Character count of instructions
         """
-        instructions = self.get_instructions()
+        instructions = self._current_instructions()
         return len(instructions) if instructions else 0
 
     def validate_instructions(self, instructions: str) -> Dict[str, Any]:
@@ -110,7 +236,7 @@ class CustomInstructionsManager:
             "warnings": [],
             "stats": {
                 "length": len(instructions),
-                "lines": len(instructions.split('\n')),
+                "lines": instructions.count('\n') + 1,
                 "words": len(instructions.split())
             }
         }
@@ -128,18 +254,10 @@ class CustomInstructionsManager:
         if len(instructions) < 10:
             result["warnings"].append("Instructions are very short, may not provide enough context")
 
-        # Check for potentially problematic content
-        problematic_phrases = [
-            "ignore all previous instructions",
-            "forget your system prompt",
-            "you are now",
-            "override your"
-        ]
-
-        lower_instructions = instructions.lower()
-        for phrase in problematic_phrases:
-            if phrase in lower_instructions:
-                result["warnings"].append(f"Instructions contain potentially problematic phrase: '{phrase}'")
+        # Check for potentially problematic content (each phrase reported once)
+        found = dict.fromkeys(m.group(0).lower() for m in _PROBLEMATIC_RE.finditer(instructions))
+        for phrase in found:
+            result["warnings"].append(f"Instructions contain potentially problematic phrase: '{phrase}'")
 
         return result
 
@@ -161,11 +279,79 @@ class CustomInstructionsManager:
 
         return instructions[:max_length] + "..."
 
+    def _backup_log_path(self) -> Path:
+        """Get the path to the compressed backup log."""
+        return get_custom_instructions_path().parent / BACKUP_LOG_NAME
+
+    @staticmethod
+    def _encode_backup_record(instructions: str, ts_ns: int) -> bytes:
+        """Encode one backup log line."""
+        record = {
+            "ts": f"{ts_ns}",
+            "sha256": hashlib.sha256(instructions.encode('utf-8')).hexdigest(),
+            "text": instructions,
+        }
+        if HAS_ORJSON:
+            return orjson.dumps(record) + b"\n"
+        return json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n"
+
+    def _iter_backup_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream backup records from the log, oldest first.
+
+        A truncated or corrupt log yields the records decoded before the
+        damaged part.
+        """
+        log_path = self._backup_log_path()
+        if not log_path.exists():
+            return
+        with gzip.open(log_path, 'rb') as f:
+            index = 0
+            try:
+                for line in f:
+                    record = orjson.loads(line) if HAS_ORJSON else json.loads(line)
+                    record["index"] = index
+                    yield record
+                    index += 1
+            except (EOFError, gzip.BadGzipFile, zlib.error, ValueError) as e:
+                logger.warning(f"Backup log {log_path} is damaged after {index} records: {e}")
+
+    def _legacy_backup_paths(self) -> List[Path]:
+        """List custom_instructions_backup_*.md files, oldest first."""
+        try:
+            with os.scandir(get_custom_instructions_path().parent) as it:
+                names = [
+                    entry.path for entry in it
+                    if entry.name.startswith(LEGACY_BACKUP_PREFIX) and entry.name.endswith(".md")
+                ]
+        except FileNotFoundError:
+            return []
+        # The timestamp suffix sorts chronologically as a string
+        names.sort()
+        return [Path(name) for name in names]
+
+    @staticmethod
+    def _legacy_backup_header(path: Path) -> Dict[str, Any]:
+        """Describe a legacy backup file in the same shape as a log record."""
+        stamp = path.name[len(LEGACY_BACKUP_PREFIX):-len(".md")]
+        try:
+            ts_ns = int(datetime.strptime(stamp, LEGACY_BACKUP_TIME_FORMAT).timestamp()) * 10**9
+        except ValueError:
+            ts_ns = path.stat().st_mtime_ns
+        text = path.read_text(encoding='utf-8')
+        return {
+            "index": None,
+            "ts": f"{ts_ns}",
+            "sha256": hashlib.sha256(text.encode('utf-8')).hexdigest(),
+            "length": len(text),
+            "path": path,
+        }
+
     def backup_instructions(self, backup_path: Optional[Path] = None) -> bool:
         """Create a backup of current instructions.
 
         Args:
-            backup_path: Path for backup file (auto-generated if None)
+            backup_path: Path for a standalone backup file; if None the
+                backup is appended to the compressed backup log
 
         Returns:
             True if backup successful
@@ -173,56 +359,118 @@ class CustomInstructionsManager:
         try:
             instructions = self.get_instructions()
             if not instructions:
-                self.logger.warning("No instructions to backup")
+                logger.warning("No instructions to backup")
                 return False
 
-            if backup_path is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_path = get_custom_instructions_path().parent / f"custom_instructions_backup_{timestamp}.md"
+            if backup_path is not None:
+                backup_path.write_text(instructions, encoding='utf-8')
+                logger.info(f"Instructions backed up to {backup_path}")
+                return True
+
+            # Nanosecond timestamps stay unique for back-to-back scripted backups
+            line = self._encode_backup_record(instructions, time.time_ns())
 
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(instructions)
+            # Each append adds a gzip member; gzip.open reads them back as one stream
+            log_path = self._backup_log_path()
+            with gzip.open(log_path, 'ab') as f:
+                f.write(line)
 
-            self.logger.info(f"Instructions backed up to {backup_path}")
+            logger.info(f"Instructions backed up to {log_path}")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to backup instructions: {e}")
+            logger.error(f"Failed to backup instructions: {e}")
             return False
 
-    def list_backups(self) -> List[Path]:
-        """List available instruction backups.
+    def list_backup_records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List instruction backups from the backup log and legacy files.
+
+        Args:
+            limit: Only return the N most recent backups (all if None)
+
+        Returns:
+            Backup headers (index, ts, sha256, length, path), most recent
+            first. Log records have an index and no path; backup files
+            written by earlier versions have a path and no index. Either
+            can be passed to restore_from_backup.
+        """
+        try:
+            headers = deque(
+                (
+                    {
+                        "index": record["index"],
+                        "ts": record["ts"],
+                        "sha256": record["sha256"],
+                        "length": len(record["text"]),
+                        "path": None,
+                    }
+                    for record in self._iter_backup_records()
+                ),
+                maxlen=limit,
+            )
+            headers.reverse()
+            if limit is None or len(headers) < limit:
+                # Legacy files predate the log, so they are the oldest backups
+                legacy = self._legacy_backup_paths()
+                if limit is not None:
+                    legacy = legacy[-(limit - len(headers)):]
+                headers.extend(self._legacy_backup_header(path) for path in reversed(legacy))
+            return list(headers)
+        except Exception as e:
+            logger.error(f"Failed to list backups: {e}")
+            return []
+
+    def list_backups(self, limit: Optional[int] = None) -> List[Path]:
+        """List instruction backup files written by earlier versions.
+
+        Deprecated: new backups are stored in the backup log and only
+        appear in list_backup_records.
+
+        Args:
+            limit: Only return the N most recent backups (all if None)
 
         Returns:
-            List of backup file paths
+            List of backup file paths, most recent first
         """
+        warnings.warn(
+            "list_backups only lists legacy backup files; use list_backup_records",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         try:
-            config_dir = get_custom_instructions_path().parent
-            backups = list(config_dir.glob("custom_instructions_backup_*.md"))
-            return sorted(backups, reverse=True)  # Most recent first
+            paths = self._legacy_backup_paths()
+            paths.reverse()
+            return paths if limit is None else paths[:limit]
         except Exception as e:
-            self.logger.error(f"Failed to list backups: {e}")
+            logger.error(f"Failed to list backups: {e}")
             return []
 
-    def restore_from_backup(self, backup_path: Path) -> bool:
+    def restore_from_backup(self, backup: Union[int, str, Path]) -> bool:
         """Restore instructions from a backup.
 
         Args:
-            backup_path: Path to backup file
+            backup: Index or timestamp of a backup log record (see
+                list_backup_records), or the path to a backup file
 
         Returns:
             True if restoration successful
         """
         try:
-            if not backup_path.exists():
-                self.logger.error(f"Backup file does not exist: {backup_path}")
-                return False
+            if isinstance(backup, Path):
+                if not backup.exists():
+                    logger.error(f"Backup file does not exist: {backup}")
+                    return False
+
+                return self.set_instructions(backup.read_text(encoding='utf-8'), save=True)
 
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                instructions = f.read()
+            key = "index" if isinstance(backup, int) else "ts"
+            for record in self._iter_backup_records():
+                if record[key] == backup:
+                    return self.set_instructions(record["text"], save=True)
 
-            return self.set_instructions(instructions, save=True)
+            logger.error(f"Backup not found: {backup}")
+            return False
         except Exception as e:
-            self.logger.error(f"Failed to restore from backup: {e}")
+            logger.error(f"Failed to restore from backup: {e}")
             return False
 
     def get_template(self, template_type: str = "basic") -> str:
@@ -234,72 +482,7 @@ class CustomInstructionsManager:
         Returns:
             Template text
         """
-        templates = {
-            "basic": """# Custom Instructions for Grok Assistant
-
-You are Grok, a helpful and maximally truthful AI assistant built by xAI.
-
-## General Guidelines
-- Be helpful, truthful, and direct
-- Use clear, concise language
-- Admit when you don't know something
-- Use markdown formatting for better readability
-
-## Response Style
-- Structure responses with headers when appropriate
-- Use bullet points or numbered lists for multiple items
-- Provide code examples when relevant
-- Explain technical concepts clearly
-
-## Tool Usage
-- Use available tools when they would help answer questions
-- Explain what tools you're using and why
-- Be efficient with tool usage
-
-## Code and Technical Topics
-- Provide working, well-commented code examples
-- Explain code logic and key concepts
-- Suggest best practices and common pitfalls
-""",
-            "developer": """# Developer-Focused Custom Instructions
-
-You are Grok, specialized in software development and programming assistance.
-
-## Coding Guidelines
-- Write clean, readable, well-documented code
-- Follow language-specific best practices
-- Use appropriate design patterns
-- Include error handling and edge cases
-
-## Development Workflow
-- Suggest efficient development workflows
-- Recommend appropriate tools and libraries
-- Help with debugging and troubleshooting
-- Provide testing strategies
-
-## Architecture & Design
-- Think about scalability and maintainability
-- Consider security implications
-- Suggest appropriate architectural patterns
-- Help with code organization and structure
-
-## Best Practices
-- Follow industry standards and conventions
-- Suggest performance optimizations
-- Include logging and monitoring considerations
-- Promote code reusability and modularity
-""",
-            "minimal": """# Minimal Custom Instructions
-
-You are Grok, a helpful AI assistant.
-
-Be concise, accurate, and helpful in your responses.
-Use tools when they provide value.
-Explain your reasoning when appropriate.
-"""
-        }
-
-        return templates.get(template_type, templates["basic"])
+        return _TEMPLATES.get(template_type, _TEMPLATES["basic"])
 
 
 # Global instance for convenience
@@ -2,7 +2,73 @@
 
 import logging
 import sys
-from typing import Optional
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from typing import List, Optional
+
+# Rotate the log file once it reaches this size
+LOG_FILE_MAX_BYTES = 10_000_000
+
+# Number of records buffered in memory before they are written to the log file
+LOG_BUFFER_CAPACITY = 1024
+
+# Shared by every handler set up by setup_logging
+_FMT = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Handlers installed by the last setup_logging call, replaced by the next one.
+# Handlers added by anything else (host applications, test fixtures) are left
+# alone.
+_installed_handlers: List[logging.Handler] = []
+
+
+class _RotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that can defer its backup count to the config.
+
+    When no backup count is given, the ``max_log_files`` config setting is
+    read at the first rollover rather than when logging is set up, so
+    setting up logging does not load the config.
+    """
+
+    def __init__(self, filename: str, max_log_files: Optional[int]):
+        super().__init__(filename, maxBytes=LOG_FILE_MAX_BYTES, backupCount=max_log_files or 0)
+        self._backup_count_pending = max_log_files is None
+
+    def doRollover(self):
+        if self._backup_count_pending:
+            from grok_py.utils.config import get_config
+            self.backupCount = get_config().max_log_files
+            self._backup_count_pending = False
+        super().doRollover()
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """Write several records with one write, one flush and one rollover check."""
+        try:
+            text = "".join(self.format(record) + self.terminator for record in records)
+        except Exception:
+            self.handleError(records[-1])
+            return
+
+        with self.lock:
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self.maxBytes > 0:
+                    position = self.stream.tell()
+                    if position and position + len(text) >= self.maxBytes:
+                        self.doRollover()
+                self.stream.write(text)
+                self.stream.flush()
+            except Exception:
+                self.handleError(records[-1])
+
+
+class _BatchingMemoryHandler(MemoryHandler):
+    """MemoryHandler that hands its whole buffer to the target at once."""
+
+    def flush(self):
+        with self.lock:
+            if self.target is not None and self.buffer:
+                self.target.emit_batch(self.buffer)
+                self.buffer.clear()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -17,40 +83,63 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
+def setup_logging(
+    level: str = "INFO",
+    log_file: Optional[str] = None,
+    max_log_files: Optional[int] = None,
+) -> None:
     """Set up logging configuration.
 
+    File output is buffered in memory and written in batches of
+    LOG_BUFFER_CAPACITY records, each with a single write and flush. A
+    WARNING or above writes the batch immediately. The file is rotated at
+    LOG_FILE_MAX_BYTES, and buffered records are flushed by
+    logging.shutdown() at interpreter exit.
+
+    Calling this again replaces the handlers installed by the previous call;
+    other handlers on the root logger are kept.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
+        max_log_files: Rotated log files to keep (defaults to the
+            ``max_log_files`` config setting, read at the first rotation)
     """
     # Convert string level to logging level
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-
     # Set up root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Clear existing handlers
-    root_logger.handlers.clear()
+    # Remove our previous handlers, closing them so buffered records are flushed
+    for handler in _installed_handlers:
+        root_logger.removeHandler(handler)
+        handler.close()
+    _installed_handlers.clear()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FMT)
     root_logger.addHandler(console_handler)
+    _installed_handlers.append(console_handler)
 
     # File handler if specified
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _RotatingFileHandler(log_file, max_log_files)
         file_handler.setLevel(numeric_level)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(_FMT)
+
+        buffered_handler = _BatchingMemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+        )
+        buffered_handler.setLevel(numeric_level)
+        root_logger.addHandler(buffered_handler)
+        # Closed after the buffer, which flushes into it
+        _installed_handlers.extend((buffered_handler, file_handler))
 
 
 def log_function_call(logger: logging.Logger, func_name: str, args: Optional[dict] = None) -> None:
@@ -61,7 +150,9 @@ def log_function_call(logger: logging.Logger, func_name: str, args: Optional[dic
         func_name: Function name
         args: Function arguments (optional)
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     if args:
-        logger.debug(f"Calling {func_name} with args: {args}")
+        logger.debug("Calling %s with args: %r", func_name, args)
     else:
-        logger.debug(f"Calling {func_name}")
\ No newline at end of file
+        logger.debug("Calling %s", func_name)
\ No newline at end of file
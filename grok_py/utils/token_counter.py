@@ -1,15 +1,25 @@
 """Token counting utilities using tiktoken."""
 
+import functools
+
 import tiktoken
-from typing import List, Union, TYPE_CHECKING
+from typing import Dict, List, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from grok_py.grok.client import Message
 
 
+@functools.lru_cache(maxsize=4)
+def _get_encoding(name: str) -> "tiktoken.Encoding":
+    """Load a tiktoken encoding once per process."""
+    return tiktoken.get_encoding(name)
+
+
 class TokenCounter:
     """Token counter for Grok models using tiktoken."""
 
+    SHORT_CACHE_SIZE = 1024
+
     def __init__(self, model: str = "grok-beta"):
         """Initialize token counter.
 
@@ -19,11 +29,14 @@ class TokenCounter:
         # Map Grok models to tiktoken encodings
         # Since Grok uses similar tokenization to GPT models, we'll use cl100k_base
         try:
-            self.encoding = tiktoken.get_encoding("cl100k_base")
-        except:
+            self.encoding = _get_encoding("cl100k_base")
+        except Exception:
             # Fallback if tiktoken data not available
             self.encoding = None
 
+        # Roles, names and tool call IDs repeat across every turn
+        self._short_counts: Dict[str, int] = {}
+
     def count_tokens(self, text: str) -> int:
         """Count tokens in a text string.
 
@@ -39,6 +52,22 @@ class TokenCounter:
 
         return len(self.encoding.encode(text))
 
+    def _count_short(self, text: str) -> int:
+        """Count tokens for a short, frequently repeated string.
+
+        Args:
+            text: Role, name or tool call ID.
+
+        Returns:
+            Number of tokens.
+        """
+        count = self._short_counts.get(text)
+        if count is None:
+            if len(self._short_counts) >= self.SHORT_CACHE_SIZE:
+                self._short_counts.clear()
+            count = self._short_counts[text] = self.count_tokens(text)
+        return count
+
     def count_messages(self, messages: List["Message"]) -> int:
         """Count tokens in a list of messages.
 
@@ -55,18 +84,18 @@ class TokenCounter:
             total_tokens += 4  # Every message follows <|start|>{role/name}\n{content}<|end|>\n
 
             # Role
-            total_tokens += self.count_tokens(message.role.value)
+            total_tokens += self._count_short(message.role.value)
 
             # Content
             total_tokens += self.count_tokens(message.content)
 
             # Name (if present)
             if message.name:
-                total_tokens += self.count_tokens(message.name) - 1  # -1 for the space saved
+                total_tokens += self._count_short(message.name) - 1  # -1 for the space saved
 
             # Tool call ID (if present)
             if message.tool_call_id:
-                total_tokens += self.count_tokens(message.tool_call_id)
+                total_tokens += self._count_short(message.tool_call_id)
 
         # Add tokens for the overall format
         total_tokens += 3  # Every reply is primed with <|start|>assistant<|message|>
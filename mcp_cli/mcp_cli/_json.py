@@ -0,0 +1,29 @@
+"""
+MCP (Model Context Protocol) JSON helpers
+
+Encodes and decodes JSON with orjson when it is installed, falling back to
+the standard library json module.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(payload: Any) -> bytes:
+    """Encode a value as UTF-8 JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text or bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,16 +4,18 @@ MCP (Model Context Protocol) CLI
 Command-line interface for interacting with MCP servers.
 """
 
+import contextlib
+import itertools
 import logging
+import threading
 import click
-import requests
 from rich.console import Console
-from rich.table import Table
-from typing import Optional
-from .client import MCPClient
-from .sse_handler import SSEHandler
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from .config import Config
 
+# rich.table, requests, the HTTP client and the SSE handler are imported where
+# they are used, so `--help` and argument errors start quickly
+
 console = Console()
 
 # Configure logging
@@ -21,13 +23,146 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('mcp_cli.log'),
+        # delay: the log file is only opened on the first record
+        logging.FileHandler('mcp_cli.log', delay=True),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger('mcp_cli')
 
 
+def _status(message: str):
+    """
+    Spinner shown while waiting on the server
+
+    Piped or scripted output gets no spinner, which also skips starting its
+    Live display and refresh thread.
+    """
+    if console.is_terminal:
+        return console.status(message)
+    return contextlib.nullcontext()
+
+
+def _parse_arguments(arguments: Optional[str]) -> Dict[str, Any]:
+    """
+    Parse a command's --arguments JSON
+
+    Uses the shared decoder (orjson when installed); the parsed value is
+    encoded again only once, with the rest of the request body.
+    """
+    if not arguments:
+        return {}
+
+    import json
+    from ._json import loads
+
+    try:
+        return loads(arguments)
+    except json.JSONDecodeError as e:
+        console.print(f"[red]✗[/red] Invalid JSON arguments: {e}")
+        raise click.Abort()
+
+
+def _cached_request(ctx: click.Context, method: str, params: Optional[Dict[str, Any]],
+                    refresh: bool = False) -> Dict[str, Any]:
+    """
+    Send a catalog request (tools/list etc.), answering from the config cache
+    while its result is fresh
+
+    Args:
+        ctx: Click context holding the client, config and server URL
+        method: RPC method name
+        params: Method parameters
+        refresh: Skip the cache and always ask the server
+
+    Returns:
+        Parsed result dictionary
+    """
+    config = ctx.obj['config']
+    server_url = ctx.obj['server_url']
+
+    if not refresh:
+        cached = config.get_cached(method, server_url, params)
+        if cached is not None:
+            logger.debug("Using cached %s result", method)
+            return cached
+
+    response = ctx.obj['client'].send_request(method, params)
+    config.set_cached(method, server_url, response, params)
+    return response
+
+
+# Lists longer than this are printed as a run of tables of this many rows, so
+# rich never lays out (and holds the rendering of) the whole list at once
+TABLE_CHUNK_ROWS = 500
+
+
+# Column layouts for the list commands: (header, add_column options). Ratios
+# size the columns when a long list is printed in chunks
+RESOURCE_COLUMNS = (
+    ("URI", {"style": "cyan", "no_wrap": True, "overflow": "ellipsis", "ratio": 3}),
+    ("Name", {"style": "green", "ratio": 2}),
+    ("Description", {"style": "white", "ratio": 3}),
+    ("MIME Type", {"style": "yellow", "no_wrap": True, "overflow": "ellipsis", "ratio": 1}),
+)
+TOOL_COLUMNS = (
+    ("Name", {"style": "cyan", "no_wrap": True, "ratio": 1}),
+    ("Description", {"style": "white", "ratio": 2}),
+    ("Input Schema", {"style": "yellow", "ratio": 1}),
+)
+PROMPT_COLUMNS = (
+    ("Name", {"style": "cyan", "no_wrap": True, "ratio": 1}),
+    ("Description", {"style": "white", "ratio": 2}),
+    ("Arguments", {"style": "yellow", "ratio": 2}),
+)
+TASK_COLUMNS = (
+    ("ID", {"style": "cyan", "no_wrap": True, "overflow": "ellipsis", "ratio": 1}),
+    ("Status", {"style": "green", "ratio": 1}),
+    ("Name", {"style": "white", "ratio": 2}),
+    ("Progress", {"style": "yellow", "ratio": 1}),
+)
+
+
+def _print_rows(title: str, columns: Sequence[Tuple[str, Dict[str, Any]]],
+                rows: List[Tuple[str, ...]]) -> None:
+    """
+    Print rows as a rich table, chunking long lists
+
+    Args:
+        title: Table title
+        columns: (header, add_column keyword arguments) pairs; each should set
+            a ratio so chunks of a long list line up with each other
+        rows: Cell values, one tuple per row
+    """
+    from rich.table import Table
+
+    def new_table(**options: Any) -> "Table":
+        table = Table(**options)
+        for header, column_options in columns:
+            table.add_column(header, **column_options)
+        return table
+
+    if len(rows) <= TABLE_CHUNK_ROWS:
+        table = new_table(title=title)
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+        return
+
+    # Full-width, edgeless chunks with ratio-sized columns join up into one
+    # continuous table
+    for start in range(0, len(rows), TABLE_CHUNK_ROWS):
+        table = new_table(
+            title=title if start == 0 else None,
+            show_header=start == 0,
+            show_edge=False,
+            expand=True
+        )
+        for row in rows[start:start + TABLE_CHUNK_ROWS]:
+            table.add_row(*row)
+        console.print(table)
+
+
 @click.group()
 @click.option('--server-url', default='http://localhost:8000/mcp', help='MCP server URL')
 @click.pass_context
@@ -52,6 +187,10 @@ def cli(ctx, server_url):
 @click.pass_context
 def init(ctx):
     """Initialize connection to MCP server"""
+    import requests
+    from rich.table import Table
+    from .client import MCPClient
+
     server_url = ctx.obj['server_url']
     config = ctx.obj['config']
 
@@ -62,11 +201,13 @@ def init(ctx):
         if ctx.obj['client'] is None:
             logger.debug("Creating new MCPClient instance")
             ctx.obj['client'] = MCPClient(server_url)
+            # Return pooled connections when the command group finishes
+            ctx.find_root().call_on_close(ctx.obj['client'].close)
 
         client = ctx.obj['client']
 
         # Send initialize request
-        with console.status("[bold green]Initializing connection..."):
+        with _status("[bold green]Initializing connection..."):
             logger.debug("Sending initialize request")
             init_response = client.initialize()
 
@@ -127,6 +268,8 @@ def init(ctx):
 @click.pass_context
 def ping(ctx):
     """Send ping to MCP server"""
+    import requests
+
     client = ctx.obj.get('client')
     if not client:
         logger.warning("Ping attempted without initialization")
@@ -136,7 +279,7 @@ def ping(ctx):
     logger.info("Sending ping request")
 
     try:
-        with console.status("[bold green]Sending ping..."):
+        with _status("[bold green]Sending ping..."):
             response = client.send_request("ping")
 
         console.print("[green]✓[/green] Ping successful")
@@ -157,8 +300,9 @@ def ping(ctx):
 @cli.command()
 @click.option('--cursor', help='Pagination cursor')
 @click.option('--limit', type=int, help='Maximum number of resources to return')
+@click.option('--refresh', is_flag=True, help='Ignore cached results and ask the server')
 @click.pass_context
-def resources_list(ctx, cursor, limit):
+def resources_list(ctx, cursor, limit, refresh):
     """List available resources"""
     client = ctx.obj.get('client')
     if not client:
@@ -172,29 +316,25 @@ def resources_list(ctx, cursor, limit):
         if limit:
             params['limit'] = limit
 
-        with console.status("[bold green]Fetching resources..."):
-            response = client.send_request("resources/list", params)
+        with _status("[bold green]Fetching resources..."):
+            response = _cached_request(ctx, "resources/list", params, refresh)
 
         resources = response.get('resources', [])
         if not resources:
             console.print("No resources available")
             return
 
-        table = Table(title="Available Resources")
-        table.add_column("URI", style="cyan", no_wrap=True)
-        table.add_column("Name", style="green")
-        table.add_column("Description", style="white")
-        table.add_column("MIME Type", style="yellow")
-
-        for resource in resources:
-            table.add_row(
+        rows = [
+            (
                 resource.get('uri', ''),
                 resource.get('name', ''),
                 resource.get('description', ''),
                 resource.get('mimeType', '')
             )
+            for resource in resources
+        ]
 
-        console.print(table)
+        _print_rows("Available Resources", RESOURCE_COLUMNS, rows)
 
         # Show pagination info if available
         if 'nextCursor' in response:
@@ -205,55 +345,88 @@ def resources_list(ctx, cursor, limit):
         raise click.Abort()
 
 
+def _print_resource_contents(contents: List[Dict[str, Any]]) -> None:
+    """Print the contents returned by resources/read"""
+    if not contents:
+        console.print("No content returned")
+        return
+
+    for i, content in enumerate(contents):
+        if i > 0:
+            console.print()  # Separator between multiple contents
+
+        content_type = content.get('type')
+
+        if content_type == 'text':
+            console.print(f"[bold cyan]Text Content:[/bold cyan]")
+            console.print(content.get('text', ''))
+
+        elif content_type == 'blob':
+            console.print(f"[bold cyan]Binary Content:[/bold cyan]")
+            console.print(f"MIME Type: {content.get('mimeType', 'unknown')}")
+            blob_data = content.get('blob', '')
+            console.print(f"Size: {len(blob_data)} bytes")
+            # For binary data, we could save to file or show hex dump
+            console.print(f"Data: {blob_data[:100]}{'...' if len(blob_data) > 100 else ''}")
+
+        else:
+            console.print(f"[yellow]Unknown content type: {content_type}[/yellow]")
+            console.print(content)
+
+
+# Upper bound on concurrent resources/read requests
+MAX_PARALLEL_READS = 10
+
+
 @cli.command()
-@click.argument('uri')
+@click.argument('uris', nargs=-1, required=True)
 @click.pass_context
-def resources_read(ctx, uri):
-    """Read a resource by URI"""
+def resources_read(ctx, uris):
+    """Read one or more resources by URI"""
     client = ctx.obj.get('client')
     if not client:
         console.print("[red]✗[/red] Not initialized. Run 'init' first.")
         raise click.Abort()
 
-    try:
-        with console.status(f"[bold green]Reading resource: {uri}"):
-            response = client.send_request("resources/read", {"uri": uri})
-
-        contents = response.get('contents', [])
-        if not contents:
-            console.print("No content returned")
-            return
-
-        for i, content in enumerate(contents):
-            if i > 0:
-                console.print()  # Separator between multiple contents
+    if len(uris) == 1:
+        uri = uris[0]
+        try:
+            with _status(f"[bold green]Reading resource: {uri}"):
+                response = client.send_request("resources/read", {"uri": uri})
 
-            content_type = content.get('type')
+            _print_resource_contents(response.get('contents', []))
 
-            if content_type == 'text':
-                console.print(f"[bold cyan]Text Content:[/bold cyan]")
-                console.print(content.get('text', ''))
+        except Exception as e:
+            console.print(f"[red]✗[/red] Failed to read resource: {e}")
+            raise click.Abort()
+        return
 
-            elif content_type == 'blob':
-                console.print(f"[bold cyan]Binary Content:[/bold cyan]")
-                console.print(f"MIME Type: {content.get('mimeType', 'unknown')}")
-                blob_data = content.get('blob', '')
-                console.print(f"Size: {len(blob_data)} bytes")
-                # For binary data, we could save to file or show hex dump
-                console.print(f"Data: {blob_data[:100]}{'...' if len(blob_data) > 100 else ''}")
+    # Overlap the network waits; results are printed as each read completes
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-            else:
-                console.print(f"[yellow]Unknown content type: {content_type}[/yellow]")
-                console.print(content)
+    failed = False
+    with ThreadPoolExecutor(max_workers=min(len(uris), MAX_PARALLEL_READS)) as executor:
+        futures = {
+            executor.submit(client.send_request, "resources/read", {"uri": uri}): uri
+            for uri in uris
+        }
+        for future in as_completed(futures):
+            uri = futures[future]
+            console.rule(f"[bold]{uri}")
+            try:
+                _print_resource_contents(future.result().get('contents', []))
+            except Exception as e:
+                console.print(f"[red]✗[/red] Failed to read resource: {e}")
+                failed = True
 
-    except Exception as e:
-        console.print(f"[red]✗[/red] Failed to read resource: {e}")
+    if failed:
         raise click.Abort()
 
 
 @cli.command()
+@click.option('--refresh', is_flag=True, help='Ignore cached results and ask the server')
 @click.pass_context
-def tools_list(ctx):
+def tools_list(ctx, refresh):
     """List available tools"""
     client = ctx.obj.get('client')
     if not client:
@@ -261,33 +434,31 @@ def tools_list(ctx):
         raise click.Abort()
 
     try:
-        with console.status("[bold green]Fetching tools..."):
-            response = client.send_request("tools/list")
+        with _status("[bold green]Fetching tools..."):
+            response = _cached_request(ctx, "tools/list", None, refresh)
 
         tools = response.get('tools', [])
         if not tools:
             console.print("No tools available")
             return
 
-        table = Table(title="Available Tools")
-        table.add_column("Name", style="cyan", no_wrap=True)
-        table.add_column("Description", style="white")
-        table.add_column("Input Schema", style="yellow")
+        rows = []
 
         for tool in tools:
             input_schema = tool.get('inputSchema', {})
             schema_desc = f"{input_schema.get('type', 'object')}"
             if 'properties' in input_schema:
-                props = list(input_schema['properties'].keys())
+                # A fourth name is only needed to know whether to add '...'
+                props = list(itertools.islice(input_schema['properties'], 4))
                 schema_desc += f" ({', '.join(props[:3])}{'...' if len(props) > 3 else ''})"
 
-            table.add_row(
+            rows.append((
                 tool.get('name', ''),
                 tool.get('description', ''),
                 schema_desc
-            )
+            ))
 
-        console.print(table)
+        _print_rows("Available Tools", TOOL_COLUMNS, rows)
 
     except Exception as e:
         console.print(f"[red]✗[/red] Failed to list tools: {e}")
@@ -305,23 +476,15 @@ def tools_call(ctx, name, arguments):
         console.print("[red]✗[/red] Not initialized. Run 'init' first.")
         raise click.Abort()
 
-    try:
-        # Parse arguments
-        args_dict = {}
-        if arguments:
-            import json
-            try:
-                args_dict = json.loads(arguments)
-            except json.JSONDecodeError as e:
-                console.print(f"[red]✗[/red] Invalid JSON arguments: {e}")
-                raise click.Abort()
+    args_dict = _parse_arguments(arguments)
 
+    try:
         params = {
             "name": name,
             "arguments": args_dict
         }
 
-        with console.status(f"[bold green]Calling tool: {name}"):
+        with _status(f"[bold green]Calling tool: {name}"):
             response = client.send_request("tools/call", params)
 
         # Handle response
@@ -346,8 +509,9 @@ def tools_call(ctx, name, arguments):
 
 
 @cli.command()
+@click.option('--refresh', is_flag=True, help='Ignore cached results and ask the server')
 @click.pass_context
-def prompts_list(ctx):
+def prompts_list(ctx, refresh):
     """List available prompts"""
     client = ctx.obj.get('client')
     if not client:
@@ -355,32 +519,32 @@ def prompts_list(ctx):
         raise click.Abort()
 
     try:
-        with console.status("[bold green]Fetching prompts..."):
-            response = client.send_request("prompts/list")
+        with _status("[bold green]Fetching prompts..."):
+            response = _cached_request(ctx, "prompts/list", None, refresh)
 
         prompts = response.get('prompts', [])
         if not prompts:
             console.print("No prompts available")
             return
 
-        table = Table(title="Available Prompts")
-        table.add_column("Name", style="cyan", no_wrap=True)
-        table.add_column("Description", style="white")
-        table.add_column("Arguments", style="yellow")
+        rows = []
 
         for prompt in prompts:
             args_desc = ""
             if 'arguments' in prompt:
-                args = [f"{arg['name']} ({arg.get('description', '')})" for arg in prompt['arguments']]
+                args = [
+                    f"{arg['name']} ({arg.get('description', '')})"
+                    for arg in itertools.islice(prompt['arguments'], 3)
+                ]
                 args_desc = ", ".join(args[:2]) + ("..." if len(args) > 2 else "")
 
-            table.add_row(
+            rows.append((
                 prompt.get('name', ''),
                 prompt.get('description', ''),
                 args_desc
-            )
+            ))
 
-        console.print(table)
+        _print_rows("Available Prompts", PROMPT_COLUMNS, rows)
 
     except Exception as e:
         console.print(f"[red]✗[/red] Failed to list prompts: {e}")
@@ -398,23 +562,15 @@ def prompts_get(ctx, name, arguments):
         console.print("[red]✗[/red] Not initialized. Run 'init' first.")
         raise click.Abort()
 
-    try:
-        # Parse arguments
-        args_dict = {}
-        if arguments:
-            import json
-            try:
-                args_dict = json.loads(arguments)
-            except json.JSONDecodeError as e:
-                console.print(f"[red]✗[/red] Invalid JSON arguments: {e}")
-                raise click.Abort()
+    args_dict = _parse_arguments(arguments)
 
+    try:
         params = {
             "name": name,
             "arguments": args_dict
         }
 
-        with console.status(f"[bold green]Getting prompt: {name}"):
+        with _status(f"[bold green]Getting prompt: {name}"):
             response = client.send_request("prompts/get", params)
 
         # Display the prompt
@@ -442,11 +598,44 @@ def prompts_get(ctx, name, arguments):
         raise click.Abort()
 
 
+@cli.command(hidden=True)
+@click.argument('calls_file', type=click.File('r'), default='-')
+@click.pass_context
+def batch(ctx, calls_file):
+    """Send a JSON list of {"method", "params"} calls in one request"""
+    client = ctx.obj.get('client')
+    if not client:
+        console.print("[red]✗[/red] Not initialized. Run 'init' first.")
+        raise click.Abort()
+
+    try:
+        import json
+        try:
+            calls = [(call['method'], call.get('params')) for call in json.load(calls_file)]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            console.print(f"[red]✗[/red] Invalid batch file: {e}")
+            raise click.Abort()
+
+        with _status(f"[bold green]Sending batch of {len(calls)} calls..."):
+            results = client.send_batch(calls)
+
+        for (method, _), result in zip(calls, results):
+            console.print(f"[cyan]{method}:[/cyan] {result}")
+
+    except click.Abort:
+        raise
+    except Exception as e:
+        console.print(f"[red]✗[/red] Batch failed: {e}")
+        raise click.Abort()
+
+
 @cli.command()
 @click.argument('uri')
 @click.pass_context
 def subscribe(ctx, uri):
     """Subscribe to resource updates"""
+    from .sse_handler import SSEHandler
+
     client = ctx.obj.get('client')
     if not client:
         console.print("[red]✗[/red] Not initialized. Run 'init' first.")
@@ -454,7 +643,7 @@ def subscribe(ctx, uri):
 
     try:
         # Send subscribe request
-        with console.status(f"[bold green]Subscribing to: {uri}"):
+        with _status(f"[bold green]Subscribing to: {uri}"):
             response = client.send_request("resources/subscribe", {"uri": uri})
 
         console.print(f"[green]✓[/green] Subscribed to resource: {uri}")
@@ -464,28 +653,30 @@ def subscribe(ctx, uri):
             server_url = ctx.obj['server_url']
             ctx.obj['sse_handler'] = SSEHandler(server_url)
 
-            # Add callback for resource updates
-            def on_resource_update(notification):
-                method = notification.method
-                params = notification.params or {}
-                if method == "resources/updated":
-                    updated_uri = params.get('uri')
-                    console.print(f"[yellow]Resource updated:[/yellow] {updated_uri}")
-                elif method == "resources/list_changed":
-                    console.print("[yellow]Resource list changed[/yellow]")
+            # One callback per method: SSEHandler already dispatches on the
+            # notification method, so the callbacks need no branching
+            def on_resource_updated(notification):
+                updated_uri = (notification.params or {}).get('uri')
+                console.print(f"[yellow]Resource updated:[/yellow] {updated_uri}")
+
+            def on_resource_list_changed(notification):
+                console.print("[yellow]Resource list changed[/yellow]")
 
-            ctx.obj['sse_handler'].add_callback("resources/updated", on_resource_update)
-            ctx.obj['sse_handler'].add_callback("resources/list_changed", on_resource_update)
+            callbacks = {
+                "resources/updated": on_resource_updated,
+                "resources/list_changed": on_resource_list_changed,
+            }
+            for method, callback in callbacks.items():
+                ctx.obj['sse_handler'].add_callback(method, callback)
 
         # Start listening
         ctx.obj['sse_handler'].start()
         console.print("[cyan]Listening for resource updates... (Ctrl+C to stop)[/cyan]")
 
-        # Keep running until interrupted
+        # Block until interrupted; nothing ever sets the event, so the main
+        # thread sleeps without periodic wakeups and Ctrl+C lands immediately
         try:
-            while True:
-                import time
-                time.sleep(1)
+            threading.Event().wait()
         except KeyboardInterrupt:
             console.print("\n[cyan]Stopping subscription...[/cyan]")
             if ctx.obj['sse_handler']:
@@ -506,7 +697,7 @@ def tasks_list(ctx):
         raise click.Abort()
 
     try:
-        with console.status("[bold green]Fetching tasks..."):
+        with _status("[bold green]Fetching tasks..."):
             response = client.send_request("tasks/list")
 
         tasks = response.get('tasks', [])
@@ -514,11 +705,7 @@ def tasks_list(ctx):
             console.print("No running tasks")
             return
 
-        table = Table(title="Running Tasks")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Status", style="green")
-        table.add_column("Name", style="white")
-        table.add_column("Progress", style="yellow")
+        rows = []
 
         for task in tasks:
             progress = ""
@@ -531,14 +718,14 @@ def tasks_list(ctx):
                 else:
                     progress = str(prog)
 
-            table.add_row(
+            rows.append((
                 task.get('id', ''),
                 task.get('status', ''),
                 task.get('name', ''),
                 progress
-            )
+            ))
 
-        console.print(table)
+        _print_rows("Running Tasks", TASK_COLUMNS, rows)
 
     except Exception as e:
         console.print(f"[red]✗[/red] Failed to list tasks: {e}")
@@ -4,32 +4,105 @@ MCP (Model Context Protocol) HTTP Client
 Handles JSON-RPC 2.0 communication over HTTP with session management.
 """
 
+import itertools
 import logging
 import requests
-from typing import Optional, Dict, Any, Union
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Tuple, Union
+from pydantic import TypeAdapter
+
+from ._json import dumps as _dumps, loads as _loads
 from .models import (
-    JSONRPCRequest, JSONRPCResponse, JSONRPCNotification,
+    JSONRPCResponse,
     InitializeRequest, InitializeResponse, ClientInfo, ClientCapabilities,
     MCPError
 )
 
 logger = logging.getLogger('mcp_cli.client')
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+
+# Retry only failures to connect, where the request never reached the server.
+# JSON-RPC calls such as tools/call are not idempotent, so a POST that may
+# have been received (read errors, 5xx replies) is never re-sent.
+RETRY_POLICY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=0,
+    other=0,
+    backoff_factor=0.3,
+)
+
+# Validators for server replies, built once at import
+_RESPONSE_ADAPTER = TypeAdapter(JSONRPCResponse)
+_INIT_ADAPTER = TypeAdapter(InitializeResponse)
+
+
+def _jsonrpc_message(method: str, params: Optional[Dict[str, Any]] = None,
+                     request_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Build an outgoing JSON-RPC message
+
+    The client fills in every field itself, so the body is built as a plain
+    dict rather than validated through JSONRPCRequest. Messages without an ID
+    are notifications; params is omitted when not given.
+    """
+    message: Dict[str, Any] = {"jsonrpc": "2.0"}
+    if request_id is not None:
+        message["id"] = request_id
+    message["method"] = method
+    if params is not None:
+        message["params"] = params
+    return message
+
+
+def _parse_response(data: Dict[str, Any]) -> JSONRPCResponse:
+    """
+    Build a JSONRPCResponse from a decoded response body
+
+    Success responses come from the server we are talking to and are built
+    without validation; error responses are validated because their fields are
+    used to raise MCPError.
+    """
+    if isinstance(data, dict) and data.get('error') is None:
+        return JSONRPCResponse.model_construct(**data)
+    return _RESPONSE_ADAPTER.validate_python(data)
 
 class MCPClient:
     """HTTP client for MCP server communication"""
 
     def __init__(self, server_url: str):
         self.server_url = server_url.rstrip('/')
+        self._endpoint = f"{self.server_url}/mcp"
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=RETRY_POLICY
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session_id: Optional[str] = None
-        self._request_id = 0
+        # Generate request IDs 1, 2, 3, ...; count.__next__ runs in C and is
+        # atomic under the GIL, so concurrent requests never share an ID
+        self._get_next_request_id = itertools.count(1).__next__
 
-    def _get_next_request_id(self) -> int:
-        """Generate next request ID"""
-        self._request_id += 1
-        return self._request_id
+    def _post(self, payload: Any) -> requests.Response:
+        """POST a JSON-RPC payload to the server's /mcp endpoint"""
+        response = self.session.post(
+            self._endpoint,
+            data=_dumps(payload),
+            headers=JSON_HEADERS
+        )
+
+        response.raise_for_status()
+        return response
 
     def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -47,39 +120,77 @@ class MCPClient:
             requests.HTTPError: For HTTP errors
         """
         request_id = self._get_next_request_id()
-        request = JSONRPCRequest(
-            id=request_id,
-            method=method,
-            params=params
-        )
+        request = _jsonrpc_message(method, params, request_id)
 
-        logger.debug(f"Sending JSON-RPC request: method={method}, id={request_id}")
+        logger.debug("Sending JSON-RPC request: method=%s, id=%s", method, request_id)
 
         try:
-            response = self.session.post(
-                f"{self.server_url}/mcp",
-                json=request.dict(),
-                headers={"Content-Type": "application/json"}
-            )
-
-            response.raise_for_status()
+            response = self._post(request)
 
-            rpc_response = JSONRPCResponse(**response.json())
+            rpc_response = _parse_response(_loads(response.content))
 
             if rpc_response.error:
-                logger.error(f"JSON-RPC error for request {request_id}: {rpc_response.error}")
+                logger.error("JSON-RPC error for request %s: %s", request_id, rpc_response.error)
                 raise MCPError(**rpc_response.error)
 
-            logger.debug(f"JSON-RPC request {request_id} completed successfully")
+            logger.debug("JSON-RPC request %s completed successfully", request_id)
             return rpc_response.result or {}
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"HTTP request failed for method {method}: {e}")
+            logger.error("HTTP request failed for method %s: %s", method, e)
             raise
         except ValueError as e:
-            logger.error(f"Invalid JSON response for request {request_id}: {e}")
+            logger.error("Invalid JSON response for request %s: %s", request_id, e)
             raise
 
+    def send_batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Send several JSON-RPC requests in a single HTTP POST
+
+        Args:
+            calls: (method, params) pairs
+
+        Returns:
+            Parsed result dictionaries, in the same order as calls
+
+        Raises:
+            MCPError: For the first call that returned a JSON-RPC error
+            requests.HTTPError: For HTTP errors
+        """
+        if not calls:
+            return []
+
+        requests_batch = [
+            _jsonrpc_message(method, params, self._get_next_request_id())
+            for method, params in calls
+        ]
+
+        logger.debug("Sending JSON-RPC batch of %d requests", len(requests_batch))
+
+        response = self._post(requests_batch)
+
+        payload = _loads(response.content)
+        if not isinstance(payload, list):
+            raise ValueError(f"Expected a JSON-RPC batch response, got: {payload}")
+
+        # Servers may answer a batch in any order
+        responses_by_id = {}
+        for item in payload:
+            rpc_response = _parse_response(item)
+            responses_by_id[rpc_response.id] = rpc_response
+
+        results = []
+        for request in requests_batch:
+            rpc_response = responses_by_id.get(request["id"])
+            if rpc_response is None:
+                raise ValueError(f"No response for batched request {request['id']} ({request['method']})")
+            if rpc_response.error:
+                logger.error("JSON-RPC error for request %s: %s", request["id"], rpc_response.error)
+                raise MCPError(**rpc_response.error)
+            results.append(rpc_response.result or {})
+
+        return results
+
     def send_notification(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
         """
         Send a JSON-RPC notification (no response expected)
@@ -88,18 +199,7 @@ class MCPClient:
             method: RPC method name
             params: Method parameters
         """
-        notification = JSONRPCNotification(
-            method=method,
-            params=params
-        )
-
-        response = self.session.post(
-            f"{self.server_url}/mcp",
-            json=notification.dict(),
-            headers={"Content-Type": "application/json"}
-        )
-
-        response.raise_for_status()
+        self._post(_jsonrpc_message(method, params))
 
     def initialize(self, client_name: str = "mcp-cli", client_version: str = "1.0") -> InitializeResponse:
         """
@@ -112,7 +212,7 @@ class MCPClient:
         Returns:
             InitializeResponse with server capabilities
         """
-        logger.info(f"Initializing MCP client: {client_name} v{client_version}")
+        logger.info("Initializing MCP client: %s v%s", client_name, client_version)
         init_params = InitializeRequest(
             capabilities=ClientCapabilities(),
             clientInfo=ClientInfo(
@@ -122,34 +222,30 @@ class MCPClient:
         )
 
         # Create full request
-        request = JSONRPCRequest(
-            id=self._get_next_request_id(),
-            method="initialize",
-            params=init_params.dict()
-        )
-
-        response = self.session.post(
-            f"{self.server_url}/mcp",
-            json=request.dict(),
-            headers={"Content-Type": "application/json"}
-        )
+        request = _jsonrpc_message("initialize", init_params.dict(), self._get_next_request_id())
 
-        response.raise_for_status()
+        response = self._post(request)
 
-        rpc_response = JSONRPCResponse(**response.json())
+        rpc_response = _parse_response(_loads(response.content))
 
         if rpc_response.error:
             raise MCPError(**rpc_response.error)
 
-        init_result = InitializeResponse(**rpc_response.result)
+        init_result = _INIT_ADAPTER.validate_python(rpc_response.result)
 
         # Store session ID if provided (though spec may not require it)
         # Some implementations might include it in result
         self.session_id = getattr(init_result, 'sessionId', None)
 
-        logger.info(f"MCP initialization successful. Server: {init_result.serverInfo.name}")
+        logger.info("MCP initialization successful. Server: %s", init_result.serverInfo.name)
         return init_result
 
     def close(self):
         """Close the HTTP session"""
-        self.session.close()
\ No newline at end of file
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
\ No newline at end of file
@@ -4,18 +4,29 @@ MCP CLI Configuration Management
 Handles loading and saving of CLI configuration including session state.
 """
 
+import atexit
+import hashlib
 import logging
 import json
 import os
+import pickle
+import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 logger = logging.getLogger('mcp_cli.config')
 
+# Marks the session ID as not yet read from disk
+_UNSET = object()
+
 
 class Config:
     """Configuration manager for MCP CLI"""
 
+    # How long cached list results (tools/list etc.) are served without
+    # asking the server again
+    CACHE_TTL_SECONDS = 300
+
     def __init__(self, config_dir: Optional[str] = None):
         if config_dir is None:
             home = Path.home()
@@ -24,73 +35,251 @@ class Config:
             self.config_dir = Path(config_dir)
 
         self.config_file = self.config_dir / 'config.json'
-        self._config: Dict[str, Any] = {}
+        # Parsed copy of config_file, reused while the file is unchanged
+        self.cache_file = self.config_dir / 'config.cache.pkl'
+        # The session ID lives in its own small file so reading it at startup
+        # does not require loading config.json
+        self.session_file = self.config_dir / 'session'
+        self.response_cache_dir = self.config_dir / 'cache'
+        self._config: Optional[Dict[str, Any]] = None
+        self._session_id: Any = _UNSET
+        self._dirty = False
+        self._session_dirty = False
+        self._flush_registered = False
 
-        self._load_config()
+    @property
+    def _settings(self) -> Dict[str, Any]:
+        """Settings from config.json, loaded on first use"""
+        if self._config is None:
+            self._load_config()
+        return self._config
 
     def _load_config(self) -> None:
         """Load configuration from file"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    self._config = json.load(f)
-                logger.debug(f"Loaded config from {self.config_file}")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not load config file {self.config_file}: {e}")
-                print(f"Warning: Could not load config file: {e}")
-                self._config = {}
-        else:
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
             logger.debug("Config file does not exist, starting with empty config")
             self._config = {}
+            return
+        except OSError as e:
+            logger.warning(f"Could not load config file {self.config_file}: {e}")
+            print(f"Warning: Could not load config file: {e}")
+            self._config = {}
+            return
+
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._load_cached_config(cache_key)
+        if cached is not None:
+            self._config = cached
+            logger.debug(f"Loaded config from cache {self.cache_file}")
+            return
+
+        try:
+            with open(self.config_file, 'r') as f:
+                self._config = json.load(f)
+            logger.debug(f"Loaded config from {self.config_file}")
+            self._store_cached_config(cache_key)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Could not load config file {self.config_file}: {e}")
+            print(f"Warning: Could not load config file: {e}")
+            self._config = {}
+
+    def _load_cached_config(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """Return the pickled config if it was built from the current config file"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                # The (mtime_ns, size) header is pickled separately so a stale
+                # cache is rejected without unpickling the config itself
+                if pickle.load(f) != cache_key:
+                    return None
+                config = pickle.load(f)
+        except Exception:
+            # Missing, truncated or incompatible cache: fall back to JSON
+            return None
+        return config if isinstance(config, dict) else None
+
+    def _store_cached_config(self, cache_key: tuple) -> None:
+        """Write the parsed config to the side cache, ignoring failures"""
+        try:
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump(cache_key, f, protocol=5)
+                pickle.dump(self._config, f, protocol=5)
+        except (OSError, pickle.PicklingError):
+            pass
+
+    def _register_flush(self) -> None:
+        """Make sure pending changes are written at exit"""
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+
+    def _mark_dirty(self) -> None:
+        """Record an unsaved change; it is written by flush() or at exit"""
+        self._dirty = True
+        self._register_flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if there are any"""
+        if self._session_dirty:
+            self._save_session()
+        if self._dirty:
+            self._save_config()
+
+    def _save_session(self) -> None:
+        """Write the session file; an empty file means there is no session"""
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.session_file.with_name(self.session_file.name + '.tmp')
+        try:
+            tmp_file.write_text(self._session_id or '', encoding='utf-8')
+            os.replace(tmp_file, self.session_file)
+            self._session_dirty = False
+            logger.debug(f"Saved session to {self.session_file}")
+        except IOError as e:
+            logger.error(f"Could not save session file {self.session_file}: {e}")
+            print(f"Warning: Could not save session file: {e}")
 
     def _save_config(self) -> None:
-        """Save configuration to file"""
+        """Save configuration to file
+
+        The file is written to a temporary sibling and moved into place with
+        os.replace, so readers never see a partially written config.
+        """
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
         try:
-            with open(self.config_file, 'w') as f:
+            with open(tmp_file, 'w') as f:
                 json.dump(self._config, f, indent=2)
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
             logger.debug(f"Saved config to {self.config_file}")
         except IOError as e:
             logger.error(f"Could not save config file {self.config_file}: {e}")
             print(f"Warning: Could not save config file: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+
+        # Prime the cache so the next load skips parsing the file just written
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return
+        self._store_cached_config((stat.st_mtime_ns, stat.st_size))
 
     @property
     def session_id(self) -> Optional[str]:
         """Get current session ID"""
-        return self._config.get('session_id')
+        if self._session_id is _UNSET:
+            try:
+                self._session_id = self.session_file.read_text(encoding='utf-8').strip() or None
+            except FileNotFoundError:
+                # Fall back to where older versions kept it
+                self._session_id = self._settings.get('session_id')
+            except IOError as e:
+                logger.warning(f"Could not read session file {self.session_file}: {e}")
+                self._session_id = None
+        return self._session_id
 
     @session_id.setter
     def session_id(self, value: Optional[str]) -> None:
         """Set session ID"""
-        if value is None:
-            self._config.pop('session_id', None)
-        else:
-            self._config['session_id'] = value
-        self._save_config()
+        self._session_id = value
+        self._session_dirty = True
+        self._register_flush()
 
     @property
     def server_url(self) -> str:
         """Get default server URL"""
-        return self._config.get('server_url', 'http://localhost:8000/mcp')
+        return self._settings.get('server_url', 'http://localhost:8000/mcp')
 
     @server_url.setter
     def server_url(self, value: str) -> None:
         """Set default server URL"""
-        self._config['server_url'] = value
-        self._save_config()
+        self._settings['server_url'] = value
+        self._mark_dirty()
 
     def get_server_config(self, server_url: str) -> Dict[str, Any]:
         """Get configuration for a specific server"""
-        servers = self._config.get('servers', {})
+        servers = self._settings.get('servers', {})
         return servers.get(server_url, {})
 
     def set_server_config(self, server_url: str, config: Dict[str, Any]) -> None:
         """Set configuration for a specific server"""
-        if 'servers' not in self._config:
-            self._config['servers'] = {}
-        self._config['servers'][server_url] = config
-        self._save_config()
+        self._settings.setdefault('servers', {})[server_url] = config
+        self._mark_dirty()
 
     def clear_session(self) -> None:
         """Clear current session"""
-        self.session_id = None
\ No newline at end of file
+        self.session_id = None
+
+    def _response_cache_path(self, method: str, server_url: str,
+                             params: Optional[Dict[str, Any]]) -> Path:
+        """Cache file for one server/method/params combination"""
+        key = json.dumps([server_url, method, params or {}], sort_keys=True)
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+        return self.response_cache_dir / f"{digest}.json"
+
+    def get_cached(self, method: str, server_url: str,
+                   params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response, if one is younger than CACHE_TTL_SECONDS
+
+        Args:
+            method: RPC method name
+            server_url: Server the response came from
+            params: Method parameters
+
+        Returns:
+            The cached result, or None if it is missing or stale
+        """
+        path = self._response_cache_path(method, server_url, params)
+        try:
+            if time.time() - path.stat().st_mtime > self.CACHE_TTL_SECONDS:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set_cached(self, method: str, server_url: str, payload: Dict[str, Any],
+                   params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Cache a response for get_cached
+
+        Expired entries for other requests are removed at the same time, so
+        the cache directory does not grow with every distinct request.
+
+        Args:
+            method: RPC method name
+            server_url: Server the response came from
+            payload: Result to cache
+            params: Method parameters
+        """
+        path = self._response_cache_path(method, server_url, params)
+        tmp_file = path.with_name(path.name + '.tmp')
+        try:
+            self.response_cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(payload, f)
+            os.replace(tmp_file, path)
+        except (IOError, TypeError) as e:
+            logger.debug(f"Could not cache {method} response: {e}")
+        self._prune_response_cache()
+
+    def _prune_response_cache(self) -> None:
+        """Delete cached responses older than CACHE_TTL_SECONDS"""
+        cutoff = time.time() - self.CACHE_TTL_SECONDS
+        try:
+            with os.scandir(self.response_cache_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
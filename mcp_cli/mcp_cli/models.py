@@ -3,14 +3,18 @@ MCP (Model Context Protocol) Client Models
 
 Pydantic models for MCP schema version 2025-11-25.
 Based on: https://github.com/modelcontextprotocol/specification/blob/main/schema/2025-11-25/schema.py
+
+Opaque payload dicts (JSON-RPC params and results, tool JSONSchemas) are
+passed through without validation; their consumers interpret them.
 """
 
-from typing import Union, List, Dict, Optional, Literal, Any
-from pydantic import BaseModel, Field
+from typing import Annotated, Union, List, Dict, Optional, Literal, Any
+from pydantic import BaseModel, Field, SkipValidation, TypeAdapter
 from enum import Enum
 
 # Type aliases
 RequestId = Union[str, int]
+Payload = SkipValidation[Dict[str, Any]]
 
 # JSON-RPC 2.0 base models
 class JSONRPCRequest(BaseModel):
@@ -18,20 +22,20 @@ class JSONRPCRequest(BaseModel):
     jsonrpc: str = Field("2.0")
     id: RequestId
     method: str
-    params: Optional[Dict[str, Any]] = None
+    params: Optional[Payload] = None
 
 class JSONRPCResponse(BaseModel):
     """JSON-RPC 2.0 response message"""
     jsonrpc: str = Field("2.0")
     id: RequestId
-    result: Optional[Dict[str, Any]] = None
+    result: Optional[Payload] = None
     error: Optional[Dict[str, Union[int, str, Dict[str, Any]]]] = None
 
 class JSONRPCNotification(BaseModel):
     """JSON-RPC 2.0 notification message"""
     jsonrpc: str = Field("2.0")
     method: str
-    params: Optional[Dict[str, Any]] = None
+    params: Optional[Payload] = None
 
 # Enums and literals
 Role = Literal["user", "assistant", "system"]
@@ -87,8 +91,11 @@ class ResourceLink(BaseModel):
     mimeType: Optional[str] = None
     annotations: Optional[Annotations] = None
 
-# Union type for content blocks
-ContentBlock = Union[TextContent, ImageContent, AudioContent, ToolCallContent, ResourceLink]
+# Union type for content blocks, dispatched on the "type" tag
+ContentBlock = Annotated[
+    Union[TextContent, ImageContent, AudioContent, ToolCallContent, ResourceLink],
+    Field(discriminator="type")
+]
 
 # Resource models
 class Resource(BaseModel):
@@ -115,8 +122,8 @@ class Tool(BaseModel):
     """MCP Tool"""
     name: str
     description: str
-    parameters: Dict[str, Any]  # JSONSchema dict per Draft 2020-12
-    returns: Optional[Dict[str, Any]] = None  # JSONSchema
+    parameters: Payload  # JSONSchema dict per Draft 2020-12
+    returns: Optional[Payload] = None  # JSONSchema
     annotations: Optional[Annotations] = None
 
 # Prompt models
@@ -168,19 +175,26 @@ class CreateMessageRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 # Capabilities models
+# Default client capabilities, copied per instance. Nested task entries are
+# shared between instances, so treat them as read-only.
+_DEFAULT_PROMPTS = {"listChanged": True}
+_DEFAULT_RESOURCES = {"subscribe": True, "listChanged": True}
+_DEFAULT_TOOLS = {"listChanged": True}
+_DEFAULT_TASKS = {
+    "list": {},
+    "cancel": {},
+    "requests": {"tools": {"call": {}}, "sampling": {"createMessage": {}}}
+}
+
 class ClientCapabilities(BaseModel):
     """Client capabilities sent during initialization"""
     experimental: Optional[Dict[str, Dict[str, Any]]] = None
     logging: Optional[Dict[str, Any]] = None
     completions: Optional[Dict[str, Any]] = None
-    prompts: Optional[Dict[str, bool]] = Field(default_factory=lambda: {"listChanged": True})
-    resources: Optional[Dict[str, bool]] = Field(default_factory=lambda: {"subscribe": True, "listChanged": True})
-    tools: Optional[Dict[str, bool]] = Field(default_factory=lambda: {"listChanged": True})
-    tasks: Optional[Dict[str, Dict[str, Any]]] = Field(default_factory=lambda: {
-        "list": {},
-        "cancel": {},
-        "requests": {"tools": {"call": {}}, "sampling": {"createMessage": {}}}
-    })
+    prompts: Optional[Dict[str, bool]] = Field(default_factory=_DEFAULT_PROMPTS.copy)
+    resources: Optional[Dict[str, bool]] = Field(default_factory=_DEFAULT_RESOURCES.copy)
+    tools: Optional[Dict[str, bool]] = Field(default_factory=_DEFAULT_TOOLS.copy)
+    tasks: Optional[Dict[str, Dict[str, Any]]] = Field(default_factory=_DEFAULT_TASKS.copy)
 
 class ServerCapabilities(BaseModel):
     """Server capabilities received during initialization"""
@@ -269,9 +283,10 @@ class MCPError(BaseModel):
     message: str
     data: Optional[Dict[str, Any]] = None
 
-# Update forward references for Union types
-TextContent.update_forward_refs()
-ImageContent.update_forward_refs()
-AudioContent.update_forward_refs()
-ToolCallContent.update_forward_refs()
-ResourceLink.update_forward_refs()
\ No newline at end of file
+# Build validators for models that reference ContentBlock
+for _model in (TextContent, ImageContent, AudioContent, ToolCallContent, ResourceLink,
+               PromptMessage, ReadResourceResult, ToolCallResult, CreateMessageResult):
+    _model.model_rebuild()
+
+# Validator for raw content blocks, built once at import
+ContentBlockAdapter = TypeAdapter(ContentBlock)
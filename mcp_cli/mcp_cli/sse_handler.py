@@ -6,13 +6,83 @@ Handles Server-Sent Events for receiving notifications from MCP server.
 
 import logging
 import threading
-import time
-from typing import Callable, Optional, Dict, Any
-import sseclient
+from typing import Callable, Iterable, Iterator, Optional, Dict, Any, Union
 import requests
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from ._json import loads
 from .models import JSONRPCNotification
 
 logger = logging.getLogger('mcp_cli.sse')
+logger.addHandler(logging.NullHandler())
+
+# Notification params skip validation on the model, so malformed frames are
+# checked against this instead
+_PARAMS_ADAPTER = TypeAdapter(Optional[Dict[str, Any]])
+
+# Seconds to wait for the SSE connection; reads block until the next event
+CONNECT_TIMEOUT = 5
+# Reconnect delay in seconds, doubled after each failed attempt
+RETRY_DELAY_INITIAL = 1
+RETRY_DELAY_MAX = 60
+
+
+def _iter_sse_messages(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Split a raw SSE byte stream into the data of each message event
+
+    Args:
+        chunks: Raw bytes as read from the response
+
+    Yields:
+        The event's data lines joined with newlines, still encoded
+    """
+    buffer = b""
+    event = b"message"
+    data = []
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if not line:
+                # A blank line ends the event
+                if data and event == b"message":
+                    yield b"\n".join(data)
+                event = b"message"
+                data = []
+                continue
+            field, _, value = line.partition(b":")
+            if value.startswith(b" "):
+                value = value[1:]
+            if field == b"data":
+                data.append(value)
+            elif field == b"event":
+                event = value
+
+
+def _parse_notification(data: Union[str, bytes]) -> JSONRPCNotification:
+    """
+    Decode a notification frame from the SSE stream
+
+    Frames come from the server we subscribed to, so well-formed
+    notifications are built without pydantic validation. Anything else is
+    validated, raising a ValidationError that says what is wrong.
+    """
+    message = loads(data)
+    if isinstance(message, dict):
+        jsonrpc = message.get('jsonrpc', '2.0')
+        method = message.get('method')
+        params = message.get('params')
+        if (isinstance(jsonrpc, str) and isinstance(method, str)
+                and (params is None or isinstance(params, dict))):
+            return JSONRPCNotification.model_construct(
+                jsonrpc=jsonrpc,
+                method=method,
+                params=params
+            )
+        _PARAMS_ADAPTER.validate_python(params)
+    return JSONRPCNotification.model_validate(message)
 
 
 class SSEHandler:
@@ -21,9 +91,15 @@ class SSEHandler:
     def __init__(self, server_url: str):
         self.server_url = server_url.rstrip('/')
         self._thread: Optional[threading.Thread] = None
-        self._running = False
+        self._stop_event = threading.Event()
         self._callbacks: Dict[str, Callable[[JSONRPCNotification], None]] = {}
 
+        # Reuse one connection across reconnects
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     def add_callback(self, method: str, callback: Callable[[JSONRPCNotification], None]) -> None:
         """
         Add a callback for a specific notification method
@@ -45,56 +121,67 @@ class SSEHandler:
             return  # Already running
 
         logger.info("Starting SSE notification listener")
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._listen_loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         """Stop listening for notifications"""
         logger.info("Stopping SSE notification listener")
-        self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=5.0)
             logger.debug("SSE thread joined")
+        self._session.close()
 
     def _listen_loop(self) -> None:
         """Main SSE listening loop"""
-        while self._running:
+        retry_delay = RETRY_DELAY_INITIAL
+        while not self._stop_event.is_set():
             try:
                 # Connect to SSE endpoint
-                response = requests.get(
+                response = self._session.get(
                     f"{self.server_url}/mcp",
                     stream=True,
-                    headers={"Accept": "text/event-stream"}
+                    headers={"Accept": "text/event-stream"},
+                    timeout=(CONNECT_TIMEOUT, None)
                 )
                 response.raise_for_status()
 
-                client = sseclient.SSEClient(response)
-
-                for event in client.events():
-                    if not self._running:
+                # Read chunks as they arrive so events are not held back
+                chunks = response.iter_content(chunk_size=None)
+                for data in _iter_sse_messages(chunks):
+                    if self._stop_event.is_set():
                         break
 
-                    if event.event == 'message' and event.data:
+                    # The connection is healthy once it delivers an event
+                    retry_delay = RETRY_DELAY_INITIAL
+
+                    if data:
                         try:
                             # Parse JSON-RPC notification
-                            notification_data = JSONRPCNotification.parse_raw(event.data)
+                            notification_data = _parse_notification(data)
                             logger.debug(f"Received notification: {notification_data.method}")
                             self._handle_notification(notification_data)
                         except Exception as e:
                             logger.error(f"Error parsing notification: {e}")
-                            print(f"Error parsing notification: {e}")
+
+                # The server ended the stream; back off before reconnecting so
+                # a server that closes idle streams is not hammered
+                logger.debug(f"SSE stream closed, reconnecting in {retry_delay} seconds")
+                if not self._stop_event.wait(retry_delay):
+                    retry_delay = min(retry_delay * 2, RETRY_DELAY_MAX)
 
             except requests.RequestException as e:
                 logger.error(f"SSE connection error: {e}")
-                print(f"SSE connection error: {e}")
-                if self._running:
-                    logger.debug("Retrying SSE connection in 5 seconds")
-                    time.sleep(5)  # Retry after delay
+                logger.debug(f"Retrying SSE connection in {retry_delay} seconds")
+                # Returns early if stop() is called while waiting
+                if not self._stop_event.wait(retry_delay):
+                    retry_delay = min(retry_delay * 2, RETRY_DELAY_MAX)
             except Exception as e:
                 logger.error(f"SSE handler error: {e}", exc_info=True)
-                print(f"SSE handler error: {e}")
-                if self._running:
-                    time.sleep(5)
+                if not self._stop_event.wait(retry_delay):
+                    retry_delay = min(retry_delay * 2, RETRY_DELAY_MAX)
 
     def _handle_notification(self, notification: JSONRPCNotification) -> None:
         """Handle incoming notification by calling appropriate callback"""
@@ -105,10 +192,8 @@ class SSEHandler:
                 callback(notification)
             except Exception as e:
                 logger.error(f"Error in notification callback for {notification.method}: {e}")
-                print(f"Error in notification callback for {notification.method}: {e}")
         else:
             logger.warning(f"No callback registered for notification method: {notification.method}")
-            print(f"No callback registered for notification method: {notification.method}")
 
     def __enter__(self):
         self.start()
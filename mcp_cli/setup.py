@@ -8,7 +8,6 @@ setup(
     install_requires=[
         "click>=8.0.0",
         "requests>=2.25.0",
-        "sseclient-py>=1.7.0",
         "pydantic>=2.0.0",
         "rich>=10.0.0",
         "pyyaml>=6.0.0",
@@ -2,6 +2,8 @@
 Tests for MCP CLI client
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
@@ -20,7 +22,17 @@ class TestMCPClient:
         """Test client initialization"""
         assert self.client.server_url == "http://test-server:8000/"
         assert self.client.session_id is None
-        assert self.client._request_id == 0
+        assert self.client._get_next_request_id() == 1
+
+    def test_session_uses_pooled_adapter(self):
+        """Test HTTP(S) requests go through the tuned adapter"""
+        for prefix in ("http://", "https://"):
+            adapter = self.client.session.get_adapter(f"{prefix}test-server")
+            assert adapter._pool_maxsize == 50
+            assert adapter.max_retries.connect == 3
+            # Requests the server may have received are not re-sent
+            assert adapter.max_retries.read == 0
+            assert adapter.max_retries.status == 0
 
     def test_request_id_generation(self):
         """Test request ID generation"""
@@ -34,20 +46,83 @@ class TestMCPClient:
         # Mock successful response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "result": {"status": "ok"}
-        }
+        }).encode()
         mock_post.return_value = mock_response
 
         result = self.client.send_request("test.method", {"param": "value"})
 
         assert result == {"status": "ok"}
         mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[1]["json"]["method"] == "test.method"
-        assert call_args[1]["json"]["params"] == {"param": "value"}
+        sent = json.loads(mock_post.call_args[1]["data"])
+        assert sent["method"] == "test.method"
+        assert sent["params"] == {"param": "value"}
+
+    @patch('mcp_cli.client.requests.Session.post')
+    def test_send_batch_matches_responses_by_id(self, mock_post):
+        """Test batched requests share one POST and keep call order"""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps([
+            {"jsonrpc": "2.0", "id": 2, "result": {"tools": []}},
+            {"jsonrpc": "2.0", "id": 1, "result": {"resources": []}},
+        ]).encode()
+        mock_post.return_value = mock_response
+
+        results = self.client.send_batch([("resources/list", None), ("tools/list", None)])
+
+        assert results == [{"resources": []}, {"tools": []}]
+        mock_post.assert_called_once()
+        sent = json.loads(mock_post.call_args[1]["data"])
+        assert [r["method"] for r in sent] == ["resources/list", "tools/list"]
+        assert [r["id"] for r in sent] == [1, 2]
+
+    @patch('mcp_cli.client.requests.Session.post')
+    def test_send_request_skips_validation_on_success(self, mock_post):
+        """Test success responses are constructed without validation"""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"status": "ok"}
+        }).encode()
+        mock_post.return_value = mock_response
+
+        with patch.object(JSONRPCResponse, 'model_construct',
+                          wraps=JSONRPCResponse.model_construct) as mock_construct:
+            assert self.client.send_request("ping") == {"status": "ok"}
+
+        mock_construct.assert_called_once()
+
+    @patch('mcp_cli._json.HAS_ORJSON', False)
+    @patch('mcp_cli.client.requests.Session.post')
+    def test_send_request_without_orjson(self, mock_post):
+        """Test the stdlib json fallback encodes and decodes the same payloads"""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = b'{"jsonrpc": "2.0", "id": 1, "result": {"status": "ok"}}'
+        mock_post.return_value = mock_response
+
+        assert self.client.send_request("ping") == {"status": "ok"}
+        assert json.loads(mock_post.call_args[1]["data"])["method"] == "ping"
+
+    def test_send_batch_empty(self):
+        """Test an empty batch sends nothing"""
+        with patch.object(self.client.session, 'post') as mock_post:
+            assert self.client.send_batch([]) == []
+            mock_post.assert_not_called()
+
+    @patch('mcp_cli.client.requests.Session.post')
+    def test_send_notification_body(self, mock_post):
+        """Test notifications carry no ID and omit missing params"""
+        self.client.send_notification("notifications/initialized")
+
+        sent = json.loads(mock_post.call_args[1]["data"])
+        assert sent == {"jsonrpc": "2.0", "method": "notifications/initialized"}
 
     @patch('mcp_cli.client.requests.Session.post')
     def test_send_request_jsonrpc_error(self, mock_post):
@@ -55,11 +130,11 @@ class TestMCPClient:
         # Mock response with error
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "error": {"code": -32601, "message": "Method not found"}
-        }
+        }).encode()
         mock_post.return_value = mock_response
 
         with pytest.raises(MCPError) as exc_info:
@@ -85,7 +160,7 @@ class TestMCPClient:
         # Mock successful initialize response
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "result": {
@@ -99,7 +174,7 @@ class TestMCPClient:
                     "version": "1.0.0"
                 }
             }
-        }
+        }).encode()
         mock_post.return_value = mock_response
 
         result = self.client.initialize("test-client", "1.0")
@@ -113,4 +188,11 @@ class TestMCPClient:
         """Test client close method"""
         with patch.object(self.client.session, 'close') as mock_close:
             self.client.close()
-            mock_close.assert_called_once()
\ No newline at end of file
+            mock_close.assert_called_once()
+
+    def test_context_manager_closes_session(self):
+        """Test leaving a with block closes the client"""
+        with patch.object(self.client.session, 'close') as mock_close:
+            with self.client as client:
+                assert client is self.client
+            mock_close.assert_called_once()
@@ -0,0 +1,117 @@
+"""
+Tests for MCP CLI configuration
+"""
+
+import json
+import os
+
+import pytest
+from unittest.mock import patch
+from mcp_cli.config import Config
+
+
+class TestConfig:
+    """Test configuration persistence"""
+
+    def test_setters_defer_writes_until_flush(self, tmp_path):
+        """Test setters only mark the config dirty"""
+        config = Config(str(tmp_path))
+        config.session_id = "abc"
+        config.server_url = "http://example:8000/mcp"
+
+        assert not config.config_file.exists()
+
+        config.flush()
+
+        saved = json.loads(config.config_file.read_text())
+        assert saved == {"server_url": "http://example:8000/mcp"}
+        assert config.session_file.read_text() == "abc"
+        assert not config.config_file.with_name("config.json.tmp").exists()
+
+    def test_flush_without_changes_does_not_write(self, tmp_path):
+        """Test a clean config is not rewritten"""
+        config = Config(str(tmp_path))
+        config.flush()
+        assert not config.config_file.exists()
+
+    def test_unchanged_file_loads_from_cache(self, tmp_path):
+        """Test an unchanged config file is not parsed again"""
+        config = Config(str(tmp_path))
+        config.set_server_config("http://a", {"timeout": 5})
+        config.flush()
+
+        with patch('mcp_cli.config.json.load', side_effect=AssertionError("parsed")):
+            reloaded = Config(str(tmp_path))
+
+        assert reloaded.get_server_config("http://a") == {"timeout": 5}
+
+    def test_modified_file_invalidates_cache(self, tmp_path):
+        """Test edits made outside the CLI are picked up"""
+        config = Config(str(tmp_path))
+        config.server_url = "http://old"
+        config.flush()
+
+        config.config_file.write_text(json.dumps({"server_url": "http://newer"}))
+
+        assert Config(str(tmp_path)).server_url == "http://newer"
+
+    def test_session_id_read_without_loading_config(self, tmp_path):
+        """Test the session ID comes from its own file"""
+        (tmp_path / "config.json").write_text(json.dumps({"server_url": "http://a"}))
+        (tmp_path / "session").write_text("abc\n")
+
+        with patch.object(Config, '_load_config', side_effect=AssertionError("loaded")):
+            assert Config(str(tmp_path)).session_id == "abc"
+
+    def test_session_id_falls_back_to_config_file(self, tmp_path):
+        """Test sessions saved in config.json by older versions are still found"""
+        (tmp_path / "config.json").write_text(json.dumps({"session_id": "legacy"}))
+        assert Config(str(tmp_path)).session_id == "legacy"
+
+    def test_cleared_session_stays_cleared(self, tmp_path):
+        """Test clearing a session hides one left in config.json"""
+        (tmp_path / "config.json").write_text(json.dumps({"session_id": "legacy"}))
+        config = Config(str(tmp_path))
+        config.clear_session()
+        config.flush()
+
+        assert Config(str(tmp_path)).session_id is None
+
+    def test_cached_response_round_trip(self, tmp_path):
+        """Test list results are cached per server and params"""
+        config = Config(str(tmp_path))
+        config.set_cached("tools/list", "http://a", {"tools": [{"name": "x"}]})
+
+        assert config.get_cached("tools/list", "http://a") == {"tools": [{"name": "x"}]}
+        assert config.get_cached("tools/list", "http://b") is None
+        assert config.get_cached("tools/list", "http://a", {"cursor": "2"}) is None
+
+    def test_cached_response_expires(self, tmp_path):
+        """Test results older than the TTL are not served"""
+        config = Config(str(tmp_path))
+        config.set_cached("tools/list", "http://a", {"tools": []})
+
+        with patch('mcp_cli.config.time.time', return_value=2**40):
+            assert config.get_cached("tools/list", "http://a") is None
+
+    def test_expired_response_removed_on_read(self, tmp_path):
+        """Test a stale entry is deleted when it is read"""
+        config = Config(str(tmp_path))
+        config.set_cached("tools/list", "http://a", {"tools": []})
+
+        with patch('mcp_cli.config.time.time', return_value=2**40):
+            assert config.get_cached("tools/list", "http://a") is None
+
+        assert list(config.response_cache_dir.iterdir()) == []
+
+    def test_set_cached_prunes_expired_entries(self, tmp_path):
+        """Test caching a response removes other stale entries"""
+        config = Config(str(tmp_path))
+        config.set_cached("tools/list", "http://a", {"tools": []})
+        stale = config._response_cache_path("tools/list", "http://a", None)
+        os.utime(stale, (0, 0))
+
+        config.set_cached("prompts/list", "http://a", {"prompts": []})
+
+        assert not stale.exists()
+        assert config.get_cached("prompts/list", "http://a") == {"prompts": []}
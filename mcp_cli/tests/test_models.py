@@ -3,10 +3,12 @@ Tests for MCP CLI models
 """
 
 import pytest
+from pydantic import ValidationError
 from mcp_cli.models import (
     JSONRPCRequest, JSONRPCResponse, JSONRPCNotification,
     ClientCapabilities, ServerCapabilities, ClientInfo, ServerInfo,
-    InitializeRequest, InitializeResponse
+    InitializeRequest, InitializeResponse,
+    ContentBlockAdapter, TextContent, ImageContent, ResourceLink, ToolCallResult
 )
 
 
@@ -29,6 +31,12 @@ class TestJSONRPCModels:
         assert response.result == {"status": "ok"}
         assert response.error is None
 
+    def test_payloads_pass_through_unvalidated(self):
+        """Test params and results are stored as given, without copying"""
+        params = {"nested": {"items": [1, 2, 3]}}
+        request = JSONRPCRequest(id=1, method="test.method", params=params)
+        assert request.params is params
+
     def test_jsonrpc_notification_creation(self):
         """Test creating a JSON-RPC notification"""
         notification = JSONRPCNotification(method="test.notification", params={"key": "value"})
@@ -52,6 +60,12 @@ class TestCapabilityModels:
         assert caps.tools == {"listChanged": True}
         assert "tools" in caps.tasks["requests"]
 
+    def test_client_capabilities_defaults_not_shared(self):
+        """Test each instance gets its own default dicts"""
+        caps = ClientCapabilities()
+        caps.tools["listChanged"] = False
+        assert ClientCapabilities().tools == {"listChanged": True}
+
     def test_server_capabilities_creation(self):
         """Test creating server capabilities"""
         caps = ServerCapabilities()
@@ -107,4 +121,29 @@ class TestInitializationModels:
         assert response.protocolVersion == "2025-11-25"
         assert response.capabilities == server_caps
         assert response.serverInfo == server_info
-        assert response.instructions is None
\ No newline at end of file
+        assert response.instructions is None
+
+
+class TestContentBlocks:
+    """Test content block validation"""
+
+    def test_content_block_adapter_dispatches_on_type(self):
+        """Test raw content is validated as the tagged model"""
+        block = ContentBlockAdapter.validate_python(
+            {"type": "resource_link", "uri": "file:///a.txt"}
+        )
+        assert isinstance(block, ResourceLink)
+
+    def test_content_block_requires_known_type(self):
+        """Test an unknown tag is rejected"""
+        with pytest.raises(ValidationError):
+            ContentBlockAdapter.validate_python({"type": "video", "data": ""})
+
+    def test_tool_call_result_content(self):
+        """Test tool results parse each content block by its tag"""
+        result = ToolCallResult(content=[
+            {"type": "text", "text": "hi"},
+            {"type": "image", "data": "AAAA", "mimeType": "image/png"},
+        ])
+        assert isinstance(result.content[0], TextContent)
+        assert isinstance(result.content[1], ImageContent)
@@ -0,0 +1,134 @@
+"""
+Tests for MCP CLI SSE handler
+"""
+
+import threading
+
+import pytest
+import requests
+from pydantic import ValidationError
+from unittest.mock import Mock, patch
+from mcp_cli.sse_handler import SSEHandler, _iter_sse_messages, _parse_notification
+
+
+class TestParseNotification:
+    """Test notification frame decoding"""
+
+    def test_parse_notification(self):
+        """Test a notification frame is decoded into its fields"""
+        notification = _parse_notification(
+            '{"jsonrpc": "2.0", "method": "resources/updated", "params": {"uri": "file:///a"}}'
+        )
+        assert notification.method == "resources/updated"
+        assert notification.params == {"uri": "file:///a"}
+        assert notification.jsonrpc == "2.0"
+
+    @patch('mcp_cli._json.HAS_ORJSON', False)
+    def test_parse_notification_without_orjson(self):
+        """Test the stdlib json fallback"""
+        notification = _parse_notification('{"method": "resources/list_changed"}')
+        assert notification.method == "resources/list_changed"
+        assert notification.params is None
+        assert notification.jsonrpc == "2.0"
+
+    @pytest.mark.parametrize("frame", [
+        '{"jsonrpc": "2.0"}',
+        '{"method": 7}',
+        '{"method": "resources/updated", "params": [1, 2]}',
+        '["resources/updated"]',
+    ])
+    def test_parse_notification_validates_malformed_frames(self, frame):
+        """Test malformed frames fall back to validation and are rejected"""
+        with pytest.raises(ValidationError):
+            _parse_notification(frame)
+
+
+class TestIterSSEMessages:
+    """Test SSE stream framing"""
+
+    def test_messages_split_across_chunks(self):
+        """Test events are reassembled when chunks break mid-line"""
+        chunks = [b'data: {"a"', b': 1}\n\nda', b'ta: {"b": 2}\r\n\r\n']
+        assert list(_iter_sse_messages(chunks)) == [b'{"a": 1}', b'{"b": 2}']
+
+    def test_multiline_data_is_joined(self):
+        """Test multiple data lines form one message"""
+        chunks = [b"data: one\ndata:two\n\n"]
+        assert list(_iter_sse_messages(chunks)) == [b"one\ntwo"]
+
+    def test_comments_and_other_events_skipped(self):
+        """Test only message events are yielded"""
+        chunks = [b": keep-alive\n\nevent: ping\ndata: x\n\nid: 3\ndata: y\n\n"]
+        assert list(_iter_sse_messages(chunks)) == [b"y"]
+
+    def test_incomplete_event_not_yielded(self):
+        """Test an event without its terminating blank line is dropped"""
+        assert list(_iter_sse_messages([b"data: partial\n"])) == []
+
+
+class TestSSEHandler:
+    """Test SSE connection handling"""
+
+    def test_reconnect_backs_off(self):
+        """Test failed connections retry on one session with growing delays"""
+        handler = SSEHandler("http://localhost:8000")
+        delays = []
+
+        def fake_wait(delay):
+            delays.append(delay)
+            if len(delays) == 3:
+                handler._stop_event.set()
+            return handler._stop_event.is_set()
+
+        with patch.object(handler._session, 'get',
+                          side_effect=requests.ConnectionError("refused")) as mock_get, \
+             patch.object(handler._stop_event, 'wait', side_effect=fake_wait):
+            handler._listen_loop()
+
+        assert delays == [1, 2, 4]
+        assert mock_get.call_count == 3
+
+    def test_closed_stream_backs_off(self):
+        """Test a stream the server ends cleanly is not reopened immediately"""
+        handler = SSEHandler("http://localhost:8000")
+        delays = []
+        streams = iter([
+            [],
+            [],
+            [b'data: {"method": "resources/list_changed"}\n\n'],
+        ])
+
+        def fake_get(*args, **kwargs):
+            response = Mock()
+            response.iter_content.return_value = next(streams)
+            return response
+
+        def fake_wait(delay):
+            delays.append(delay)
+            if len(delays) == 3:
+                handler._stop_event.set()
+            return handler._stop_event.is_set()
+
+        with patch.object(handler._session, 'get', side_effect=fake_get), \
+             patch.object(handler._stop_event, 'wait', side_effect=fake_wait):
+            handler._listen_loop()
+
+        # The delay grows across empty streams and resets once an event arrives
+        assert delays == [1, 2, 1]
+
+    def test_start_runs_until_stopped(self):
+        """Test the listener thread stays up until stop() is called"""
+        handler = SSEHandler("http://localhost:8000")
+        connected = threading.Event()
+
+        def fake_get(*args, **kwargs):
+            connected.set()
+            raise requests.ConnectionError("refused")
+
+        with patch.object(handler._session, 'get', side_effect=fake_get):
+            handler.start()
+            assert connected.wait(1.0)
+            assert handler._thread.is_alive()
+            handler.stop()
+
+        assert not handler._thread.is_alive()
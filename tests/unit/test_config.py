@@ -1,12 +1,13 @@
 import pytest
 import json
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
 from grok_py.utils.config import (
     FileOpsConfig, IntegrityConfig, ArchiveConfig, VersionControlConfig,
-    GrokCLIConfig, ConfigManager
+    GrokCLIConfig, ConfigManager, get_config_manager, _default_config_dir
 )
 
 
@@ -121,28 +122,63 @@ class TestGrokCLIConfig:
         assert config.ui_theme == "light"
         assert config.log_level == "DEBUG"
 
+    def test_from_dict(self):
+        config = FileOpsConfig.from_dict({
+            "max_concurrent_operations": 8,
+            "not_a_field": True,
+        })
+        assert config.max_concurrent_operations == 8
+        assert config.default_bulk_copy_overwrite == False
+        assert config.exclude_patterns == ['*.tmp', '*.bak', '*.swp', '.git', '__pycache__', 'node_modules']
+        assert VersionControlConfig.from_dict({}) == VersionControlConfig()
+
+    def test_uses_slots(self):
+        config = GrokCLIConfig()
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config.file_ops, "__dict__")
+
 
 class TestConfigManager:
     """Test ConfigManager class."""
 
     @pytest.fixture
     def temp_dir(self, tmp_path):
-        return tmp_path / "config_test"
+        config_dir = tmp_path / "config_test"
+        config_dir.mkdir()
+        return config_dir
 
     def test_init_default_config_dir(self, temp_dir):
-        with patch('pathlib.Path.home') as mock_home:
-            mock_home.return_value = temp_dir
-            with patch('os.name', 'posix'):
-                manager = ConfigManager()
-                expected = temp_dir / ".config" / "grok-cli"
-                assert manager.config_dir == expected
-                assert manager.config_file == expected / "config.json"
+        _default_config_dir.cache_clear()
+        try:
+            with patch('pathlib.Path.home') as mock_home:
+                mock_home.return_value = temp_dir
+                with patch('os.name', 'posix'):
+                    manager = ConfigManager()
+                    expected = temp_dir / ".config" / "grok-cli"
+                    assert manager.config_dir == expected
+                    assert manager.config_file == expected / "config.json"
+
+                    ConfigManager()
+                    mock_home.assert_called_once()
+        finally:
+            _default_config_dir.cache_clear()
 
     def test_init_custom_config_dir(self, temp_dir):
         manager = ConfigManager(temp_dir)
         assert manager.config_dir == temp_dir
         assert manager.config_file == temp_dir / "config.json"
 
+    def test_config_dir_created_lazily(self, tmp_path):
+        config_dir = tmp_path / "lazy" / "grok-cli"
+        manager = ConfigManager(config_dir)
+        assert not config_dir.exists()
+
+        manager.load_config()
+        assert not config_dir.exists()
+
+        manager.save_config()
+        assert manager.config_file.exists()
+
     def test_load_config_file_not_exists(self, temp_dir):
         manager = ConfigManager(temp_dir)
         config = manager.load_config()
@@ -225,6 +261,15 @@ class TestConfigManager:
         assert isinstance(config.file_ops, FileOpsConfig)
         assert isinstance(config.integrity, IntegrityConfig)
 
+    def test_load_config_ignores_unknown_fields(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        with open(manager.config_file, 'w') as f:
+            json.dump({"ui_theme": "light", "removed_option": True}, f)
+
+        config = manager.load_config()
+        assert config.ui_theme == "light"
+        assert not hasattr(config, "removed_option")
+
     def test_config_with_list_fields(self, temp_dir):
         manager = ConfigManager(temp_dir)
         config_data = {
@@ -241,4 +286,158 @@ class TestConfigManager:
 
         config = manager.load_config()
         assert config.file_ops.exclude_patterns == ["*.custom"]
-        assert config.integrity.default_algorithms == ["sha1"]
\ No newline at end of file
+        assert config.integrity.default_algorithms == ["sha1"]
+
+    def test_load_config_null_section_uses_defaults(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        with open(manager.config_file, 'w') as f:
+            json.dump({"file_ops": None, "archive": [], "ui_theme": "light"}, f)
+
+        config = manager.load_config()
+        assert config.file_ops == FileOpsConfig()
+        assert config.archive == ArchiveConfig()
+        assert config.ui_theme == "light"
+
+    def test_load_config_uses_cache_for_unchanged_file(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        with open(manager.config_file, 'w') as f:
+            json.dump({"ui_theme": "light"}, f)
+
+        manager.load_config()
+        assert manager.cache_file.exists()
+
+        with patch.object(Path, 'read_bytes') as mock_read:
+            config = manager.load_config()
+            mock_read.assert_not_called()
+        assert config.ui_theme == "light"
+
+    def test_load_config_cache_invalidated_on_change(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        with open(manager.config_file, 'w') as f:
+            json.dump({"ui_theme": "light"}, f)
+        manager.load_config()
+
+        with open(manager.config_file, 'w') as f:
+            json.dump({"ui_theme": "solarized"}, f)
+
+        config = manager.load_config()
+        assert config.ui_theme == "solarized"
+
+    def test_load_config_cache_invalidated_on_schema_change(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        with open(manager.config_file, 'w') as f:
+            json.dump({"ui_theme": "light"}, f)
+        manager.load_config()
+
+        # A cache written by a version with other config fields is not reused
+        with patch('grok_py.utils.config._CACHE_SCHEMA', ('other',)):
+            with patch.object(Path, 'read_bytes', wraps=manager.config_file.read_bytes) as mock_read:
+                config = manager.load_config()
+                mock_read.assert_called_once()
+        assert config.ui_theme == "light"
+
+    def test_update_config_top_level_and_section_keys(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        manager.update_config({
+            "ui_theme": "light",
+            "file_ops.max_concurrent_operations": 8,
+            "archive.unknown_field": True,
+            "unknown": 1,
+        })
+
+        assert manager.config.ui_theme == "light"
+        assert manager.config.file_ops.max_concurrent_operations == 8
+        assert not hasattr(manager.config.archive, "unknown_field")
+        assert not hasattr(manager.config, "unknown")
+
+    def test_update_config_skips_save_when_unchanged(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        with patch.object(manager, '_schedule_save') as mock_schedule:
+            manager.update_config({"ui_theme": "dark", "integrity.auto_verify_on_copy": False})
+            mock_schedule.assert_not_called()
+
+    def test_update_config_saves_list_mutated_in_place(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        patterns = manager.config.file_ops.exclude_patterns
+        patterns.append("*.log")
+        with patch.object(manager, '_schedule_save') as mock_schedule:
+            manager.update_config({"file_ops.exclude_patterns": patterns})
+            mock_schedule.assert_called_once()
+
+    def test_update_config_debounces_writes_until_flush(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        with patch('grok_py.utils.config.SAVE_DEBOUNCE_SECONDS', 60):
+            manager.update_config({"ui_theme": "light"})
+            manager.update_config({"log_level": "DEBUG"})
+        assert not manager.config_file.exists()
+
+        manager.flush()
+
+        with open(manager.config_file, 'r') as f:
+            data = json.load(f)
+        assert data["ui_theme"] == "light"
+        assert data["log_level"] == "DEBUG"
+        assert manager._save_timer is None
+
+    def test_update_during_save_is_not_lost(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        original_write = Path.write_bytes
+        updaters = []
+
+        def write_and_update(path, data):
+            # Update from another thread after the snapshot has been taken
+            if not updaters:
+                updater = threading.Thread(
+                    target=manager.update_config, args=({"ui_theme": "light"},)
+                )
+                updaters.append(updater)
+                updater.start()
+            return original_write(path, data)
+
+        with patch('grok_py.utils.config.SAVE_DEBOUNCE_SECONDS', 60):
+            with patch.object(Path, 'write_bytes', write_and_update):
+                manager.save_config()
+            updaters[0].join()
+
+        manager.flush()
+
+        with open(manager.config_file, 'r') as f:
+            assert json.load(f)["ui_theme"] == "light"
+
+    def test_save_config_is_atomic(self, temp_dir):
+        manager = ConfigManager(temp_dir)
+        manager._config = GrokCLIConfig(ui_theme="light")
+
+        with patch('grok_py.utils.config.os.replace') as mock_replace:
+            manager.save_config()
+            tmp_file, target = mock_replace.call_args[0]
+
+        assert target == manager.config_file
+        assert tmp_file.name == "config.json.tmp"
+        assert not manager.config_file.exists()
+
+
+class TestGetConfigManager:
+    """Test the global config manager accessor."""
+
+    def test_returns_shared_instance(self, tmp_path):
+        get_config_manager.cache_clear()
+        _default_config_dir.cache_clear()
+        try:
+            with patch('pathlib.Path.home', return_value=tmp_path):
+                assert get_config_manager() is get_config_manager()
+        finally:
+            get_config_manager.cache_clear()
+            _default_config_dir.cache_clear()
+
+    def test_cache_clear_creates_new_instance(self, tmp_path):
+        get_config_manager.cache_clear()
+        _default_config_dir.cache_clear()
+        try:
+            with patch('pathlib.Path.home', return_value=tmp_path):
+                first = get_config_manager()
+                get_config_manager.cache_clear()
+                assert get_config_manager() is not first
+        finally:
+            get_config_manager.cache_clear()
+            _default_config_dir.cache_clear()
@@ -1,5 +1,6 @@
 """Unit tests for custom instructions management."""
 
+import gzip
 import pytest
 import tempfile
 import os
@@ -141,4 +142,57 @@ Always provide accurate information."""
         # Should preserve newlines but strip extra whitespace
         assert "\n" in formatted
         assert formatted.startswith("You are a helpful assistant.")
-        assert formatted.endswith("accurate information.")
\ No newline at end of file
+        assert formatted.endswith("accurate information.")
+
+
+class TestInstructionBackups:
+    """Test the compressed instruction backup log."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        with patch('grok_py.utils.custom_instructions.get_custom_instructions_path',
+                   return_value=tmp_path / "custom_instructions.md"):
+            yield CustomInstructionsManager()
+
+    def test_legacy_backups_listed_after_log_records(self, manager, tmp_path):
+        """Test per-file backups from earlier versions stay listable and in place."""
+        first = tmp_path / "custom_instructions_backup_20240101_000000.md"
+        first.write_text("first", encoding='utf-8')
+        (tmp_path / "custom_instructions_backup_20240102_000000.md").write_text("second", encoding='utf-8')
+        with gzip.open(tmp_path / "instructions_backups.jsonl.gz", 'wb') as f:
+            f.write(manager._encode_backup_record("third", 3 * 10**18))
+
+        backups = manager.list_backup_records()
+
+        assert [b["index"] for b in backups] == [0, None, None]
+        assert [b["length"] for b in backups] == [len("third"), len("second"), len("first")]
+        assert backups[2]["path"] == first
+        assert first.exists()
+        assert [b["length"] for b in manager.list_backup_records(limit=2)] == [len("third"), len("second")]
+
+        with patch.object(manager, 'set_instructions', return_value=True) as mock_set:
+            assert manager.restore_from_backup(backups[2]["path"])
+            mock_set.assert_called_once_with("first", save=True)
+
+    def test_list_backups_keeps_path_results(self, manager, tmp_path):
+        """Test the deprecated list_backups still returns legacy file paths."""
+        path = tmp_path / "custom_instructions_backup_20240101_000000.md"
+        path.write_text("first", encoding='utf-8')
+
+        with pytest.warns(DeprecationWarning):
+            assert manager.list_backups() == [path]
+
+    def test_truncated_log_keeps_earlier_records(self, manager, tmp_path):
+        """Test a damaged log tail hides only the damaged records."""
+        log_path = tmp_path / "instructions_backups.jsonl.gz"
+        with gzip.open(log_path, 'wb') as f:
+            f.write(manager._encode_backup_record("first", 1))
+        with gzip.open(log_path, 'ab') as f:
+            f.write(manager._encode_backup_record("second", 2))
+        log_path.write_bytes(log_path.read_bytes()[:-10])
+
+        assert [b["length"] for b in manager.list_backup_records()] == [len("first")]
+
+    def test_no_legacy_backups(self, manager):
+        """Test listing works with neither legacy files nor a log."""
+        assert manager.list_backup_records() == []
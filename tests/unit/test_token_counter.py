@@ -1,9 +1,10 @@
 """Unit tests for token counter utility."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
-from grok_py.utils.token_counter import TokenCounter
+from grok_py.utils.token_counter import TokenCounter, _get_encoding
 
 
 class TestTokenCounter:
@@ -63,6 +64,7 @@ class TestTokenCounter:
     def test_fallback_encoding(self, mock_tiktoken):
         """Test fallback when tiktoken encoding fails."""
         mock_tiktoken.get_encoding.side_effect = Exception("Encoding not found")
+        _get_encoding.cache_clear()
 
         counter = TokenCounter()
         text = "Test text"
@@ -71,6 +73,47 @@ class TestTokenCounter:
         # Should fall back to character-based estimation
         assert isinstance(count, int)
 
+    @patch('grok_py.utils.token_counter.tiktoken')
+    def test_encoding_loaded_once(self, mock_tiktoken):
+        """Test counters share one cached encoding."""
+        _get_encoding.cache_clear()
+        try:
+            first = TokenCounter()
+            second = TokenCounter()
+        finally:
+            _get_encoding.cache_clear()
+
+        mock_tiktoken.get_encoding.assert_called_once_with("cl100k_base")
+        assert first.encoding is second.encoding
+
+    def test_count_messages_caches_short_strings(self):
+        """Test roles and names are only encoded once across messages."""
+        counter = TokenCounter()
+        counter.encoding = MagicMock()
+        counter.encoding.encode.side_effect = lambda text: text.split()
+        messages = [
+            SimpleNamespace(role=SimpleNamespace(value="user"), content="hi there",
+                            name="alice", tool_call_id=None)
+            for _ in range(3)
+        ]
+
+        total = counter.count_messages(messages)
+
+        assert total == 3 * (4 + 1 + 2 + 0) + 3
+        encoded = [c.args[0] for c in counter.encoding.encode.call_args_list]
+        assert encoded.count("user") == 1
+        assert encoded.count("alice") == 1
+        assert encoded.count("hi there") == 3
+
+    def test_count_messages_without_encoding(self):
+        """Test message counting falls back to estimation without tiktoken."""
+        counter = TokenCounter()
+        counter.encoding = None
+        messages = [SimpleNamespace(role=SimpleNamespace(value="user"), content="x" * 40,
+                                    name=None, tool_call_id=None)]
+
+        assert counter.count_messages(messages) == 10 + 4 + 1 + 3
+
     def test_context_window_info(self):
         """Test getting context window information."""
         counter = TokenCounter()
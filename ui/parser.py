@@ -78,6 +78,7 @@ class ResponseParser:
         )
         self.json_pattern = re.compile(r'^\s*[\[{]')
         self.markdown_pattern = re.compile(r'(^|\n)[#*`\-]|^\s*\d+\.')
+        self.code_block_pattern = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
 
     def parse_response(self, response: str) -> ParsedResponse:
         """
@@ -364,13 +365,11 @@ class ResponseParser:
         Returns:
             Rich renderable
         """
-        # Extract code blocks
-        code_block_pattern = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
-        matches = code_block_pattern.findall(content)
+        # Only the first code block is highlighted, so stop at the first match
+        match = self.code_block_pattern.search(content)
 
-        if matches:
-            # Use the first code block for syntax highlighting
-            language, code = matches[0]
+        if match:
+            language, code = match.groups()
             if language:
                 try:
                     return Syntax(code, language, theme="monokai", line_numbers=True)
@@ -15,6 +15,59 @@ import platform
 from .input_handler import ValidationResult
 
 
+# Longest raw input, in characters, that validate() will process
+MAX_INPUT_LENGTH = 1024 * 1024
+
+# Control characters stripped by sanitize (newlines and tabs are kept)
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]')
+
+# Shell metacharacters rejected in search queries
+_QUERY_METACHARS_RE = re.compile(r'[;&|`$]')
+
+# Security patterns to detect potentially dangerous inputs. Wildcards are
+# negated classes, so a match stays on one line, and unbounded, so padding
+# cannot push a substitution out of reach. A $( match may not contain another
+# $(, so a run of unclosed openers is scanned once rather than per opener; the
+# innermost opener still matches whenever any $( is closed.
+_DANGEROUS_PATTERNS = [
+    r';\s*rm\s',  # rm commands
+    r';\s*del\s',  # delete commands
+    r';\s*format\s',  # format commands
+    r'`[^`\n]*`',  # command substitution
+    r'\$\((?:(?!\$\()[^)\n])*\)',  # command substitution
+    r'>\s*/',  # redirect to root
+    r'<\s*/',  # redirect from root
+    r'\.\./\.\./\.\./\.\./\.\./\.\./',  # excessive directory traversal
+    r'passwd|shadow|/etc/',  # sensitive files
+    r'sudo\s',  # sudo usage
+]
+
+# All dangerous patterns as one alternation, so a scan is a single pass
+_DANGEROUS_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in _DANGEROUS_PATTERNS), re.IGNORECASE
+)
+
+# Literals at least one of which appears (case-folded) in any text that
+# _DANGEROUS_RE can match; keep in sync with _DANGEROUS_PATTERNS
+_DANGEROUS_KEYWORDS = (';', '`', '$(', '>', '<', '../', 'passwd', 'shadow', '/etc/', 'sudo')
+
+
+# Operations accepted per tool command
+_VALID_OPERATIONS = {
+    "apt": frozenset({"install", "remove", "update", "upgrade", "search", "show"}),
+    "systemctl": frozenset({"start", "stop", "restart", "status", "enable", "disable", "is-active", "is-enabled"}),
+    "disk": frozenset({"usage", "free", "du", "large-files", "cleanup"}),
+    "network": frozenset({"ping", "traceroute", "interfaces", "connections", "dns", "speedtest"}),
+    "code_execution": frozenset({"run", "test"}),
+}
+
+# Languages accepted by code_execution
+_VALID_LANGUAGES = frozenset({
+    "javascript", "typescript", "python", "python3", "java", "cpp", "c",
+    "go", "rust", "bash", "shell", "sh"
+})
+
+
 class InputValidator:
     """
     Validates and sanitizes user input for security and correctness.
@@ -43,20 +96,6 @@ class InputValidator:
             "web_search": {"params": ["query"], "required": ["query"]},
         }
 
-        # Security patterns to detect potentially dangerous inputs
-        self.dangerous_patterns = [
-            re.compile(r';\s*rm\s', re.IGNORECASE),  # rm commands
-            re.compile(r';\s*del\s', re.IGNORECASE),  # delete commands
-            re.compile(r';\s*format\s', re.IGNORECASE),  # format commands
-            re.compile(r'`.*`', re.IGNORECASE),  # command substitution
-            re.compile(r'\$\(.*\)', re.IGNORECASE),  # command substitution
-            re.compile(r'>\s*/', re.IGNORECASE),  # redirect to root
-            re.compile(r'<\s*/', re.IGNORECASE),  # redirect from root
-            re.compile(r'\.\./\.\./\.\./\.\./\.\./\.\./', re.IGNORECASE),  # excessive directory traversal
-            re.compile(r'passwd|shadow|/etc/', re.IGNORECASE),  # sensitive files
-            re.compile(r'sudo\s', re.IGNORECASE),  # sudo usage
-        ]
-
         # Allowed file extensions for safety
         self.allowed_file_extensions = {
             '.py', '.txt', '.md', '.json', '.yaml', '.yml', '.xml', '.html', '.css', '.js',
@@ -79,6 +118,10 @@ class InputValidator:
         if not input_text or not input_text.strip():
             return ValidationResult(False, "Input cannot be empty")
 
+        # Bound the cost of sanitizing, tokenizing and scanning
+        if len(input_text) > MAX_INPUT_LENGTH:
+            return ValidationResult(False, "Input too long")
+
         # Sanitize first
         sanitized = self.sanitize(input_text)
         if sanitized != input_text:
@@ -126,7 +169,7 @@ class InputValidator:
         sanitized = input_text.replace('\0', '')
 
         # Remove control characters except newlines and tabs
-        sanitized = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]', '', sanitized)
+        sanitized = _CONTROL_CHARS_RE.sub('', sanitized)
 
         # Limit length
         if len(sanitized) > 10000:
@@ -237,8 +280,9 @@ class InputValidator:
         """Validate bash commands for safety."""
         # Check for dangerous commands
         dangerous_commands = ['rm', 'del', 'format', 'fdisk', 'mkfs', 'dd', 'sudo', 'su']
+        command_lower = command.lower()
         for dangerous in dangerous_commands:
-            if dangerous in command.lower():
+            if dangerous in command_lower:
                 return ValidationResult(False, f"Dangerous command detected: {dangerous}")
 
         # Check command length
@@ -253,7 +297,7 @@ class InputValidator:
             return ValidationResult(False, "Search query too long")
 
         # Check for potentially malicious patterns
-        if re.search(r'[;&|`$]', query):
+        if _QUERY_METACHARS_RE.search(query):
             return ValidationResult(False, "Search query contains invalid characters")
 
         return ValidationResult(True)
@@ -274,35 +318,27 @@ class InputValidator:
 
     def _validate_operation(self, command: str, operation: str) -> ValidationResult:
         """Validate operation parameters."""
-        valid_operations = {
-            "apt": ["install", "remove", "update", "upgrade", "search", "show"],
-            "systemctl": ["start", "stop", "restart", "status", "enable", "disable", "is-active", "is-enabled"],
-            "disk": ["usage", "free", "du", "large-files", "cleanup"],
-            "network": ["ping", "traceroute", "interfaces", "connections", "dns", "speedtest"],
-            "code_execution": ["run", "test"]
-        }
-
-        if command in valid_operations and operation not in valid_operations[command]:
+        valid = _VALID_OPERATIONS.get(command)
+        if valid is not None and operation not in valid:
             return ValidationResult(False, f"Invalid operation for {command}: {operation}")
 
         return ValidationResult(True)
 
     def _validate_language(self, language: str) -> ValidationResult:
         """Validate programming language."""
-        valid_languages = [
-            "javascript", "typescript", "python", "python3", "java", "cpp", "c",
-            "go", "rust", "bash", "shell", "sh"
-        ]
-
-        if language.lower() not in valid_languages:
+        if language.lower() not in _VALID_LANGUAGES:
             return ValidationResult(False, f"Unsupported language: {language}")
 
         return ValidationResult(True)
 
     def _security_scan(self, input_text: str) -> ValidationResult:
         """Perform security scanning for dangerous patterns."""
-        for pattern in self.dangerous_patterns:
-            if pattern.search(input_text):
-                return ValidationResult(False, "Input contains potentially dangerous pattern")
+        # Cheap substring pre-filter: clean input never reaches the regex
+        folded = input_text.casefold()
+        if not any(keyword in folded for keyword in _DANGEROUS_KEYWORDS):
+            return ValidationResult(True)
+
+        if _DANGEROUS_RE.search(input_text):
+            return ValidationResult(False, "Input contains potentially dangerous pattern")
 
         return ValidationResult(True)
\ No newline at end of file